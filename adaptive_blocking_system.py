@@ -21,16 +21,18 @@ Key Features:
 - Legitimate user protection
 """
 
+import bisect
 import threading
 import time
 import json
 import sqlite3
+import socket
+import struct
 import logging
+from collections import deque
 from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-from datetime import datetime, timedelta
-import statistics
 import math
 
 
@@ -50,6 +52,49 @@ class BlockingState(Enum):
     CLEARED = "cleared"
 
 
+# Precomputed enum labels (avoid the Enum.value descriptor in hot paths)
+THREAT_LEVEL_NAMES = {level: level.value for level in ThreatLevel}
+BLOCKING_STATE_NAMES = {state: state.value for state in BlockingState}
+
+# Monotonic clock span used for history and policy expiry
+_DAY_NS = 24 * 3600 * 10**9
+
+# Threat level for each bin between the medium/high/critical cut points
+_LEVELS_BY_BIN = (ThreatLevel.LOW, ThreatLevel.MEDIUM, ThreatLevel.HIGH, ThreatLevel.CRITICAL)
+
+# Baseline thresholds that update_network_conditions scales
+_BASE_THRESHOLDS = (
+    ('low_threat', 0.3),
+    ('medium_threat', 0.6),
+    ('high_threat', 0.8),
+    ('critical_threat', 0.9)
+)
+
+# Network condition dimensions tracked in the rolling daily-max profile
+_CONDITION_KEYS = ('load', 'attack_frequency', 'false_positive_rate', 'legitimate_traffic_ratio')
+PROFILE_DAYS = 7
+
+# Component weights of ThreatScore.total_score (base, reputation, behavior, pattern)
+_BASE_WEIGHT = 0.3
+_REPUTATION_WEIGHT = 0.2
+_BEHAVIOR_WEIGHT = 0.3
+_PATTERN_WEIGHT = 0.2
+
+_LOW_THREAT_REASON = f"Threat level {THREAT_LEVEL_NAMES[ThreatLevel.LOW]} below blocking threshold"
+
+_IPV4 = struct.Struct('!I')
+
+
+def ip_to_u32(ip_address: str) -> Optional[int]:
+    """Convert a dotted-quad IPv4 address to an int (None if not IPv4)"""
+    # inet_pton only takes canonical dotted quads; inet_aton would also map
+    # forms like '10.1' or '010.0.0.1' onto another address's key
+    try:
+        return _IPV4.unpack(socket.inet_pton(socket.AF_INET, ip_address))[0]
+    except OSError:
+        return None
+
+
 @dataclass
 class ThreatScore:
     """Comprehensive threat scoring"""
@@ -62,18 +107,11 @@ class ThreatScore:
     
     def calculate_total(self):
         """Calculate total threat score"""
-        weights = {
-            'base': 0.3,
-            'reputation': 0.2,
-            'behavior': 0.3,
-            'pattern': 0.2
-        }
-        
         self.total_score = (
-            self.base_score * weights['base'] +
-            self.reputation_score * weights['reputation'] +
-            self.behavior_score * weights['behavior'] +
-            self.pattern_score * weights['pattern']
+            self.base_score * _BASE_WEIGHT +
+            self.reputation_score * _REPUTATION_WEIGHT +
+            self.behavior_score * _BEHAVIOR_WEIGHT +
+            self.pattern_score * _PATTERN_WEIGHT
         )
         
         return self.total_score
@@ -85,23 +123,23 @@ class AdaptiveBlockingPolicy:
     ip_address: str
     threat_level: ThreatLevel
     threat_score: ThreatScore
-    block_start_time: datetime
+    block_start_ns: int  # time.monotonic_ns() when the block started
     initial_duration: int  # seconds
     current_duration: int  # seconds
     max_duration: int  # seconds
     blocking_state: BlockingState
     unblock_attempts: int = 0
     false_positive_score: float = 0.0
-    last_activity: Optional[datetime] = None
+    last_activity: Optional[int] = None  # time.monotonic_ns()
     reputation_history: List[float] = field(default_factory=list)
     behavior_patterns: Dict[str, float] = field(default_factory=dict)
     
-    def should_unblock(self, current_time: datetime) -> bool:
+    def should_unblock(self, now_ns: int) -> bool:
         """Determine if IP should be unblocked based on adaptive criteria"""
         if self.blocking_state != BlockingState.ACTIVE:
             return False
         
-        elapsed = (current_time - self.block_start_time).total_seconds()
+        elapsed = (now_ns - self.block_start_ns) * 1e-9
         
         # Basic time-based unblocking
         if elapsed >= self.current_duration:
@@ -143,9 +181,18 @@ class AdaptiveBlockingPolicy:
 class ReputationSystem:
     """IP reputation tracking system"""
     
-    def __init__(self, db_path: str = "reputation.db"):
+    def __init__(self, db_path: str = "reputation.db",
+                 decay_tau: float = 7 * 24 * 3600, decay_delta: float = 0.3):
         self.db_path = db_path
         self.lock = threading.Lock()
+        # Scores age back towards neutral over decay_tau seconds following
+        # the polynomial decay base * (1 - (t/tau)^(1/delta)) (MISP model)
+        self.decay_tau = decay_tau
+        self.decay_delta = decay_delta
+        # In-memory (score, last_seen) keyed by u32 for IPv4 (raw string otherwise),
+        # plus one bit per /24 so unknown blocks are answered without a lookup
+        self._scores: Dict[object, Tuple[float, float]] = {}
+        self._block_bits = bytearray(1 << 21)
         self._init_database()
         
     def _init_database(self):
@@ -163,17 +210,51 @@ class ReputationSystem:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             ''')
+            cursor = conn.execute(
+                "SELECT ip_address, reputation_score, strftime('%s', last_seen) FROM reputation"
+            )
+            for ip_address, score, last_seen in cursor:
+                self._cache_score(ip_address, score, float(last_seen or 0))
+    
+    def _cache_score(self, ip_address: str, score: float, last_seen: float):
+        """Store score in the in-memory table and mark its /24 block"""
+        ip_u32 = ip_to_u32(ip_address)
+        if ip_u32 is None:
+            self._scores[ip_address] = (score, last_seen)
+            return
+        block = ip_u32 >> 8
+        self._block_bits[block >> 3] |= 1 << (block & 7)
+        self._scores[ip_u32] = (score, last_seen)
+    
+    def _decayed(self, score: float, last_seen: float) -> float:
+        """Age a stored score towards neutral in closed form"""
+        age = time.time() - last_seen
+        if age <= 0:
+            return score
+        if age >= self.decay_tau:
+            return 0.5
+        return 0.5 + (score - 0.5) * (1.0 - (age / self.decay_tau) ** (1.0 / self.decay_delta))
     
     def get_reputation(self, ip_address: str) -> float:
         """Get reputation score for IP address"""
-        with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    'SELECT reputation_score FROM reputation WHERE ip_address = ?',
-                    (ip_address,)
-                )
-                result = cursor.fetchone()
-                return result[0] if result else 0.5  # Default neutral reputation
+        ip_u32 = ip_to_u32(ip_address)
+        if ip_u32 is None:
+            entry = self._scores.get(ip_address)
+            return self._decayed(*entry) if entry else 0.5  # Default neutral reputation
+        return self.get_reputation_u32(ip_u32)
+    
+    def get_reputation_u32(self, ip_u32: int) -> float:
+        """Get reputation score for an IPv4 address given as u32"""
+        block = ip_u32 >> 8
+        if not self._block_bits[block >> 3] & (1 << (block & 7)):
+            return 0.5  # Nothing scored in this /24
+        entry = self._scores.get(ip_u32)
+        return self._decayed(*entry) if entry else 0.5
+    
+    def get_reputations(self, ip_addresses: List[str]) -> Dict[str, float]:
+        """Get reputation scores for several IP addresses"""
+        get_reputation = self.get_reputation
+        return {ip_address: get_reputation(ip_address) for ip_address in ip_addresses}
     
     def update_reputation(self, ip_address: str, is_malicious: bool, is_false_positive: bool = False):
         """Update reputation based on behavior"""
@@ -181,13 +262,14 @@ class ReputationSystem:
             with sqlite3.connect(self.db_path) as conn:
                 # Get current reputation
                 cursor = conn.execute(
-                    'SELECT reputation_score, total_connections, malicious_connections, legitimate_connections, false_positives FROM reputation WHERE ip_address = ?',
+                    "SELECT reputation_score, strftime('%s', last_seen), total_connections, malicious_connections, legitimate_connections, false_positives FROM reputation WHERE ip_address = ?",
                     (ip_address,)
                 )
                 result = cursor.fetchone()
                 
                 if result:
-                    current_score, total, malicious, legitimate, false_pos = result
+                    stored_score, last_seen, total, malicious, legitimate, false_pos = result
+                    current_score = self._decayed(stored_score, float(last_seen or 0))
                 else:
                     current_score, total, malicious, legitimate, false_pos = 0.5, 0, 0, 0, 0
                 
@@ -220,6 +302,7 @@ class ReputationSystem:
                     (ip_address, reputation_score, total_connections, malicious_connections, legitimate_connections, false_positives, last_seen)
                     VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
                 ''', (ip_address, new_score, total, malicious, legitimate, false_pos))
+            self._cache_score(ip_address, new_score, time.time())
     
     def get_reputation_history(self, ip_address: str) -> Dict[str, int]:
         """Get reputation history for IP"""
@@ -240,63 +323,133 @@ class ReputationSystem:
                 return {'total': 0, 'malicious': 0, 'legitimate': 0, 'false_positives': 0}
 
 
+# Fixed column order for traffic samples (row form of a traffic metrics dict).
+# Units: packet_rate packets/s, byte_rate bytes/s, connection_rate new
+# connections/s, unique_ports a count, burst_ratio and repetition_ratio
+# fractions in [0, 1]. byte_rate reaches millions, so the columns stay
+# plain numbers rather than a 16-bit fixed-point encoding.
+METRIC_FIELDS = ('packet_rate', 'byte_rate', 'connection_rate',
+                 'burst_ratio', 'unique_ports', 'repetition_ratio')
+
+# Samples kept per IP: scoring looks at the last 20, legitimacy at the last 10
+HISTORY_WINDOW = 20
+
+
+def _mean_std(values) -> Tuple[float, float]:
+    """Mean and sample standard deviation of a short window (two-pass, float)"""
+    n = len(values)
+    mean = math.fsum(values) / n
+    if n < 2:
+        return mean, 0.0
+    return mean, math.sqrt(math.fsum([(v - mean) ** 2 for v in values]) / (n - 1))
+
+
+class TrafficHistory:
+    """Per-IP ring buffer of traffic samples stored column-wise"""
+    __slots__ = ('timestamps', 'columns')
+    
+    def __init__(self, window: int = HISTORY_WINDOW):
+        self.timestamps = deque(maxlen=window)
+        self.columns = {metric: deque(maxlen=window) for metric in METRIC_FIELDS}
+    
+    def __len__(self):
+        return len(self.timestamps)
+    
+    def append(self, timestamp, row):
+        """Append one sample given in METRIC_FIELDS order"""
+        self.timestamps.append(timestamp)
+        for column, value in zip(self.columns.values(), row):
+            column.append(value)
+    
+    def prune(self, cutoff):
+        """Drop samples not newer than cutoff (timestamps are in order)"""
+        timestamps = self.timestamps
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
+            for column in self.columns.values():
+                column.popleft()
+
+
 class BehaviorAnalyzer:
     """Analyzes traffic patterns to improve blocking decisions"""
     
     def __init__(self):
-        self.traffic_patterns = {}
+        self.traffic_patterns: Dict[str, TrafficHistory] = {}
         self.baseline_patterns = {}
         self.lock = threading.Lock()
         
     def analyze_traffic_pattern(self, ip_address: str, traffic_metrics: Dict[str, float]) -> Dict[str, float]:
         """Analyze traffic patterns for behavioral scoring"""
+        return self.analyze_traffic_row(
+            ip_address, [traffic_metrics.get(metric, 0) for metric in METRIC_FIELDS]
+        )
+    
+    def analyze_traffic_row(self, ip_address: str, row) -> Dict[str, float]:
+        """Analyze one traffic sample given in METRIC_FIELDS order"""
         with self.lock:
-            # Store traffic pattern
-            if ip_address not in self.traffic_patterns:
-                self.traffic_patterns[ip_address] = []
+            history = self._record_row(ip_address, row)
             
-            self.traffic_patterns[ip_address].append({
-                'timestamp': datetime.now(),
-                'metrics': traffic_metrics.copy()
-            })
+            # Calculate behavior score
+            return self._calculate_behavior_score(history, row)
+    
+    def analyze_batch(self, ip_address: str, rows) -> List[Dict[str, float]]:
+        """Analyze several samples in order, as repeated analyze_traffic_row calls would"""
+        with self.lock:
+            history = self._get_history(ip_address)
             
-            # Keep only recent patterns (last 24 hours)
-            cutoff_time = datetime.now() - timedelta(hours=24)
-            self.traffic_patterns[ip_address] = [
-                pattern for pattern in self.traffic_patterns[ip_address]
-                if pattern['timestamp'] > cutoff_time
-            ]
+            # One timestamp for the whole batch, so expiry only needs one pass
+            now = time.monotonic_ns()
+            history.prune(now - _DAY_NS)
             
-            # Calculate behavior score
-            return self._calculate_behavior_score(ip_address, traffic_metrics)
+            analyses = []
+            for row in rows:
+                history.append(now, row)
+                analyses.append(self._calculate_behavior_score(history, row))
+            return analyses
+    
+    def record_traffic_pattern(self, ip_address: str, traffic_metrics: Dict[str, float]):
+        """Add a traffic sample to the history without scoring it"""
+        with self.lock:
+            self._record_row(ip_address, [traffic_metrics.get(metric, 0) for metric in METRIC_FIELDS])
     
-    def _calculate_behavior_score(self, ip_address: str, current_metrics: Dict[str, float]) -> Dict[str, float]:
+    def _record_row(self, ip_address: str, row) -> TrafficHistory:
+        """Store one sample and expire old ones (caller holds the lock)"""
+        history = self._get_history(ip_address)
+        
+        now = time.monotonic_ns()
+        history.append(now, row)
+        
+        # Keep only recent patterns (last 24 hours)
+        history.prune(now - _DAY_NS)
+        return history
+    
+    def _get_history(self, ip_address: str) -> TrafficHistory:
+        """History for an IP, created on first use (caller holds the lock)"""
+        history = self.traffic_patterns.get(ip_address)
+        if history is None:
+            history = self.traffic_patterns[ip_address] = TrafficHistory()
+        return history
+    
+    def _calculate_behavior_score(self, history: TrafficHistory, current_row) -> Dict[str, float]:
         """Calculate behavioral score based on traffic patterns"""
-        patterns = self.traffic_patterns.get(ip_address, [])
-        if len(patterns) < 5:  # Not enough data
+        if len(history) < 5:  # Not enough data
             return {'behavior_score': 0.5, 'confidence': 0.1}
         
-        # Calculate deviations from normal patterns
-        normal_patterns = [p['metrics'] for p in patterns[-20:]]  # Last 20 patterns
-        
+        # Calculate deviations from normal patterns (the whole window)
         deviations = {}
-        for metric in current_metrics:
-            if metric in normal_patterns[0]:
-                values = [p[metric] for p in normal_patterns if metric in p]
-                if values:
-                    avg = statistics.mean(values)
-                    std = statistics.stdev(values) if len(values) > 1 else 0
-                    
-                    if std > 0:
-                        deviation = abs(current_metrics[metric] - avg) / std
-                        deviations[metric] = deviation
+        for (metric, column), current in zip(history.columns.items(), current_row):
+            avg, std = _mean_std(column)
+            
+            if std > 0:
+                deviation = abs(current - avg) / std
+                deviations[metric] = deviation
         
         # Calculate overall behavior score
         if deviations:
-            avg_deviation = statistics.mean(deviations.values())
+            avg_deviation = math.fsum(deviations.values()) / len(deviations)
             # Higher deviation = more suspicious
             behavior_score = min(1.0, avg_deviation / 3.0)  # Normalize
-            confidence = min(1.0, len(patterns) / 20.0)  # More patterns = higher confidence
+            confidence = min(1.0, len(history) / 20.0)  # More patterns = higher confidence
         else:
             behavior_score = 0.5
             confidence = 0.1
@@ -309,17 +462,15 @@ class BehaviorAnalyzer:
     
     def is_legitimate_pattern(self, ip_address: str, threshold: float = 0.3) -> bool:
         """Determine if traffic pattern indicates legitimate user"""
-        patterns = self.traffic_patterns.get(ip_address, [])
-        if len(patterns) < 10:
+        history = self.traffic_patterns.get(ip_address)
+        if history is None or len(history) < 10:
             return False  # Not enough data
         
         # Check for consistent, moderate traffic patterns
-        recent_patterns = patterns[-10:]
-        packet_rates = [p['metrics'].get('packet_rate', 0) for p in recent_patterns]
+        packet_rates = list(history.columns['packet_rate'])[-10:]
         
         if packet_rates:
-            avg_rate = statistics.mean(packet_rates)
-            std_rate = statistics.stdev(packet_rates) if len(packet_rates) > 1 else 0
+            avg_rate, std_rate = _mean_std(packet_rates)
             
             # Legitimate users typically have:
             # - Moderate packet rates (not too high)
@@ -356,14 +507,12 @@ class AdaptiveBlockingSystem:
             'false_positive_rate': 0.0,
             'legitimate_traffic_ratio': 0.0
         }
+        # Rolling profile: (day, [daily max per _CONDITION_KEYS]) for the last week
+        self._daily_max = deque(maxlen=PROFILE_DAYS)
         
         # Adaptive thresholds
-        self.dynamic_thresholds = {
-            'low_threat': 0.3,
-            'medium_threat': 0.6,
-            'high_threat': 0.8,
-            'critical_threat': 0.9
-        }
+        self.dynamic_thresholds = dict(_BASE_THRESHOLDS)
+        self._rebuild_threshold_cuts()
         
         # Start monitoring thread
         self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
@@ -373,22 +522,26 @@ class AdaptiveBlockingSystem:
     
     def calculate_threat_score(self, ip_address: str, traffic_metrics: Dict[str, float]) -> ThreatScore:
         """Calculate comprehensive threat score"""
+        reputation = self.reputation_system.get_reputation(ip_address)
+        return self._score_traffic(ip_address, traffic_metrics, reputation)
+    
+    def calculate_threat_score_batch(self, ip_addresses: List[str],
+                                     traffic_metrics_list: List[Dict[str, float]]) -> List[ThreatScore]:
+        """Calculate threat scores for several IPs, fetching reputations in one query"""
+        reputations = self.reputation_system.get_reputations(ip_addresses)
+        return [
+            self._score_traffic(ip_address, traffic_metrics, reputations[ip_address])
+            for ip_address, traffic_metrics in zip(ip_addresses, traffic_metrics_list)
+        ]
+    
+    def _score_traffic(self, ip_address: str, traffic_metrics: Dict[str, float], reputation: float) -> ThreatScore:
+        """Build the threat score for one IP given its current reputation"""
         threat_score = ThreatScore()
         
         # Base score from traffic metrics
-        packet_rate = traffic_metrics.get('packet_rate', 0)
-        byte_rate = traffic_metrics.get('byte_rate', 0)
-        connection_rate = traffic_metrics.get('connection_rate', 0)
-        
-        # Normalize and weight base metrics
-        threat_score.base_score = min(1.0, (
-            (packet_rate / 1000.0) * 0.4 +
-            (byte_rate / 1000000.0) * 0.3 +
-            (connection_rate / 100.0) * 0.3
-        ))
+        threat_score.base_score = self._calculate_base_score(traffic_metrics)
         
         # Reputation score
-        reputation = self.reputation_system.get_reputation(ip_address)
         threat_score.reputation_score = 1.0 - reputation  # Invert: low reputation = high threat
         
         # Behavior score
@@ -404,6 +557,19 @@ class AdaptiveBlockingSystem:
         
         return threat_score
     
+    def _calculate_base_score(self, traffic_metrics: Dict[str, float]) -> float:
+        """Calculate the rate-based threat score"""
+        packet_rate = traffic_metrics.get('packet_rate', 0)
+        byte_rate = traffic_metrics.get('byte_rate', 0)
+        connection_rate = traffic_metrics.get('connection_rate', 0)
+        
+        # Normalize and weight base metrics
+        return min(1.0, (
+            (packet_rate / 1000.0) * 0.4 +
+            (byte_rate / 1000000.0) * 0.3 +
+            (connection_rate / 100.0) * 0.3
+        ))
+    
     def _calculate_pattern_score(self, ip_address: str, traffic_metrics: Dict[str, float]) -> float:
         """Calculate pattern-based threat score"""
         # Simple pattern matching - could be enhanced with ML
@@ -427,18 +593,24 @@ class AdaptiveBlockingSystem:
         
         return min(1.0, score)
     
+    def _rebuild_threshold_cuts(self):
+        """Cache the ascending level cut points used by determine_threat_level"""
+        self._threshold_cuts = (
+            self.dynamic_thresholds['medium_threat'],
+            self.dynamic_thresholds['high_threat'],
+            self.dynamic_thresholds['critical_threat']
+        )
+    
     def determine_threat_level(self, threat_score: ThreatScore) -> ThreatLevel:
         """Determine threat level based on adaptive thresholds"""
-        total_score = threat_score.total_score
-        
-        if total_score >= self.dynamic_thresholds['critical_threat']:
-            return ThreatLevel.CRITICAL
-        elif total_score >= self.dynamic_thresholds['high_threat']:
-            return ThreatLevel.HIGH
-        elif total_score >= self.dynamic_thresholds['medium_threat']:
-            return ThreatLevel.MEDIUM
-        else:
-            return ThreatLevel.LOW
+        # Number of cut points <= score selects LOW/MEDIUM/HIGH/CRITICAL
+        return _LEVELS_BY_BIN[bisect.bisect_right(self._threshold_cuts, threat_score.total_score)]
+    
+    def determine_threat_levels(self, threat_scores: List[ThreatScore]) -> List[ThreatLevel]:
+        """Determine threat levels for several scores"""
+        cuts = self._threshold_cuts
+        bisect_right = bisect.bisect_right
+        return [_LEVELS_BY_BIN[bisect_right(cuts, score.total_score)] for score in threat_scores]
     
     def create_adaptive_policy(self, ip_address: str, threat_score: ThreatScore) -> AdaptiveBlockingPolicy:
         """Create adaptive blocking policy based on threat assessment"""
@@ -477,7 +649,7 @@ class AdaptiveBlockingSystem:
             ip_address=ip_address,
             threat_level=threat_level,
             threat_score=threat_score,
-            block_start_time=datetime.now(),
+            block_start_ns=time.monotonic_ns(),
             initial_duration=initial_duration,
             current_duration=initial_duration,
             max_duration=max_duration,
@@ -488,6 +660,21 @@ class AdaptiveBlockingSystem:
     
     def should_block(self, ip_address: str, traffic_metrics: Dict[str, float]) -> Tuple[bool, str]:
         """Determine if IP should be blocked based on adaptive criteria"""
+        policy = self.active_policies.get(ip_address)
+        if policy is None or policy.blocking_state != BlockingState.ACTIVE:
+            # Fast path: bound the total with the worst behavior score; if even
+            # that stays below the medium cut the IP is LOW and needs no full
+            # scoring (the sample is still recorded for behavior analysis)
+            upper_bound = ThreatScore(
+                base_score=self._calculate_base_score(traffic_metrics),
+                reputation_score=1.0 - self.reputation_system.get_reputation(ip_address),
+                behavior_score=1.0,
+                pattern_score=self._calculate_pattern_score(ip_address, traffic_metrics)
+            ).calculate_total()
+            if upper_bound < self._threshold_cuts[0]:
+                self.behavior_analyzer.record_traffic_pattern(ip_address, traffic_metrics)
+                return False, _LOW_THREAT_REASON
+        
         threat_score = self.calculate_threat_score(ip_address, traffic_metrics)
         threat_level = self.determine_threat_level(threat_score)
         
@@ -495,7 +682,7 @@ class AdaptiveBlockingSystem:
         if ip_address in self.active_policies:
             policy = self.active_policies[ip_address]
             if policy.blocking_state == BlockingState.ACTIVE:
-                return False, f"Already blocked (threat level: {threat_level.value})"
+                return False, f"Already blocked (threat level: {THREAT_LEVEL_NAMES[threat_level]})"
         
         # Check if threat level warrants blocking
         if threat_level in [ThreatLevel.MEDIUM, ThreatLevel.HIGH, ThreatLevel.CRITICAL]:
@@ -510,10 +697,10 @@ class AdaptiveBlockingSystem:
                 if reputation > 0.8:
                     return False, "High reputation score"
             
-            reason = f"Threat level {threat_level.value} (score: {threat_score.total_score:.3f})"
+            reason = f"Threat level {THREAT_LEVEL_NAMES[threat_level]} (score: {threat_score.total_score:.3f})"
             return True, reason
         
-        return False, f"Threat level {threat_level.value} below blocking threshold"
+        return False, f"Threat level {THREAT_LEVEL_NAMES[threat_level]} below blocking threshold"
     
     def block_ip(self, ip_address: str, traffic_metrics: Dict[str, float]) -> AdaptiveBlockingPolicy:
         """Block IP with adaptive policy"""
@@ -532,14 +719,14 @@ class AdaptiveBlockingSystem:
             priority=10,
             metadata={
                 "type": "adaptive_blocking",
-                "threat_level": policy.threat_level.value,
+                "threat_level": THREAT_LEVEL_NAMES[policy.threat_level],
                 "threat_score": policy.threat_score.total_score,
                 "initial_duration": policy.initial_duration,
                 "max_duration": policy.max_duration
             }
         )
         
-        self.logger.warning(f"🚫 Adaptive block: {ip_address} (threat: {policy.threat_level.value}, duration: {policy.initial_duration}s)")
+        self.logger.warning(f"🚫 Adaptive block: {ip_address} (threat: {THREAT_LEVEL_NAMES[policy.threat_level]}, duration: {policy.initial_duration}s)")
         return policy
     
     def should_unblock(self, ip_address: str) -> Tuple[bool, str]:
@@ -548,10 +735,10 @@ class AdaptiveBlockingSystem:
             return False, "IP not currently blocked"
         
         policy = self.active_policies[ip_address]
-        current_time = datetime.now()
+        now_ns = time.monotonic_ns()
         
         # Check basic unblocking condition
-        if policy.should_unblock(current_time):
+        if policy.should_unblock(now_ns):
             # Additional checks before unblocking
             
             # Check if this was likely a false positive
@@ -563,7 +750,7 @@ class AdaptiveBlockingSystem:
                 return True, "Legitimate traffic pattern observed"
             
             # Time-based unblocking
-            elapsed = (current_time - policy.block_start_time).total_seconds()
+            elapsed = (now_ns - policy.block_start_ns) * 1e-9
             if elapsed >= policy.current_duration:
                 return True, f"Blocking duration expired ({elapsed:.0f}s)"
         
@@ -612,14 +799,7 @@ class AdaptiveBlockingSystem:
     def update_network_conditions(self, conditions: Dict[str, float]):
         """Update network conditions for adaptive thresholds"""
         self.network_conditions.update(conditions)
-        
-        # Adjust thresholds based on conditions
-        base_thresholds = {
-            'low_threat': 0.3,
-            'medium_threat': 0.6,
-            'high_threat': 0.8,
-            'critical_threat': 0.9
-        }
+        self._record_daily_max()
         
         # Adjust based on attack frequency
         attack_freq = conditions.get('attack_frequency', 0)
@@ -639,15 +819,38 @@ class AdaptiveBlockingSystem:
             multiplier *= 1.1
         
         # Update thresholds
-        for key, base_value in base_thresholds.items():
+        for key, base_value in _BASE_THRESHOLDS:
             self.dynamic_thresholds[key] = min(0.95, base_value * multiplier)
+        self._rebuild_threshold_cuts()
+    
+    def _record_daily_max(self):
+        """Fold the current network conditions into today's profile slot"""
+        day = time.monotonic_ns() // _DAY_NS
+        values = [self.network_conditions.get(key, 0.0) for key in _CONDITION_KEYS]
+        
+        # Drop days that fell out of the window (updates may skip days)
+        while self._daily_max and self._daily_max[0][0] <= day - PROFILE_DAYS:
+            self._daily_max.popleft()
+        
+        if self._daily_max and self._daily_max[-1][0] == day:
+            today = self._daily_max[-1][1]
+            for i, value in enumerate(values):
+                if value > today[i]:
+                    today[i] = value
+        else:
+            self._daily_max.append((day, values))
+    
+    def get_network_profile(self) -> Dict[str, float]:
+        """Get the maximum of each network condition over the profile window"""
+        if not self._daily_max:
+            return dict.fromkeys(_CONDITION_KEYS, 0.0)
+        columns = zip(*(values for _, values in self._daily_max))
+        return dict(zip(_CONDITION_KEYS, map(max, columns)))
     
     def _monitoring_loop(self):
         """Background monitoring loop for adaptive policies"""
         while True:
             try:
-                current_time = datetime.now()
-                
                 # Check all active policies
                 with self.lock:
                     policies_to_update = list(self.active_policies.items())
@@ -673,14 +876,13 @@ class AdaptiveBlockingSystem:
     
     def _cleanup_old_policies(self):
         """Clean up old policies"""
-        current_time = datetime.now()
-        cutoff_time = current_time - timedelta(hours=24)
+        cutoff_ns = time.monotonic_ns() - _DAY_NS
         
         with self.lock:
             to_remove = []
             for ip_address, policy in self.active_policies.items():
                 if (policy.blocking_state == BlockingState.CLEARED and 
-                    policy.block_start_time < cutoff_time):
+                    policy.block_start_ns < cutoff_ns):
                     to_remove.append(ip_address)
             
             for ip_address in to_remove:
@@ -692,14 +894,13 @@ class AdaptiveBlockingSystem:
             return None
         
         policy = self.active_policies[ip_address]
-        current_time = datetime.now()
-        elapsed = (current_time - policy.block_start_time).total_seconds()
+        elapsed = (time.monotonic_ns() - policy.block_start_ns) * 1e-9
         
         return {
             'ip_address': ip_address,
-            'threat_level': policy.threat_level.value,
+            'threat_level': THREAT_LEVEL_NAMES[policy.threat_level],
             'threat_score': policy.threat_score.total_score,
-            'blocking_state': policy.blocking_state.value,
+            'blocking_state': BLOCKING_STATE_NAMES[policy.blocking_state],
             'elapsed_time': elapsed,
             'remaining_time': max(0, policy.current_duration - elapsed),
             'initial_duration': policy.initial_duration,
@@ -720,7 +921,7 @@ class AdaptiveBlockingSystem:
             
             threat_levels = {}
             for policy in self.active_policies.values():
-                level = policy.threat_level.value
+                level = THREAT_LEVEL_NAMES[policy.threat_level]
                 threat_levels[level] = threat_levels.get(level, 0) + 1
         
         return {
@@ -729,7 +930,8 @@ class AdaptiveBlockingSystem:
             'total_policies': len(self.active_policies),
             'threat_level_distribution': threat_levels,
             'network_conditions': self.network_conditions.copy(),
-            'dynamic_thresholds': self.dynamic_thresholds.copy()
+            'dynamic_thresholds': self.dynamic_thresholds.copy(),
+            'network_profile': self.get_network_profile()
         }
 
 
@@ -13,16 +13,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from operator import attrgetter
+from collections import defaultdict
 from ryu.base import app_manager
 from ryu.controller import ofp_event
 from ryu.controller.handler import CONFIG_DISPATCHER, MAIN_DISPATCHER, DEAD_DISPATCHER
 from ryu.controller.handler import set_ev_cls
 from ryu.ofproto import ofproto_v1_3
-from ryu.lib.packet import packet
-from ryu.lib.packet import ethernet
 from ryu.lib.packet import ether_types
+from ryu.lib.mac import haddr_to_str
 from ryu.lib import hub
+import logging
+import struct
 import time
 
 timeInterval = 10
@@ -32,6 +33,40 @@ RED = "\033[91m"
 GREEN = "\033[92m"
 RESET = "\033[0m"
 
+# Header Ethernet: dst (6 byte), src (6 byte), ethertype
+ETH_HEADER = struct.Struct("!6s6sH")
+
+# Stats precedenti di una porta non ancora monitorata
+ZERO_STATS = (0, 0, 0, 0, 0, 0)
+
+# Azioni restituite da update_alarm
+ALARM_NONE = 0
+ALARM_LOCK = 1
+ALARM_WARN = 2
+ALARM_UNLOCK = 3
+
+
+# Aggiorna lo stato di allarme [contatore, bloccata] di una porta e restituisce
+# l'azione da eseguire. Lavora solo su interi, senza accessi allo stato del
+# controller, così da poter essere testata o compilata separatamente.
+def update_alarm(alarm, over_threshold):
+    if over_threshold:
+        if alarm[0] < 3:  # Se per 30 secondi la threshold è superata, allora allarma.
+            alarm[0] += 1
+    elif alarm[0] > 0:
+        alarm[0] -= 1
+
+    if alarm[0] == 3:
+        alarm[1] = 1
+        return ALARM_LOCK
+    if alarm[1] == 1:
+        if alarm[0] == 2:
+            return ALARM_WARN
+        if alarm[0] == 1:
+            alarm[1] = 0
+            return ALARM_UNLOCK
+    return ALARM_NONE
+
 
 class SimpleSwitch13(app_manager.RyuApp):
     OFP_VERSIONS = [ofproto_v1_3.OFP_VERSION]
@@ -43,14 +78,21 @@ class SimpleSwitch13(app_manager.RyuApp):
 
     def __init__(self, *args, **kwargs):
         super(SimpleSwitch13, self).__init__(*args, **kwargs)
-        self.send_req = 0
-        self.rec_res = 0
         self.threshold = 700000  # 80-90% del percorso critico
-        self.time = 0
+        # Istante di inizio del giro di monitoraggio corrente e switch che
+        # devono ancora rispondere
+        self.tick_t0 = 0
+        self.pending_replies = set()
+        self.effective_interval = timeInterval
         self.datapaths = {}
-        self.mac_to_port = {}
+        self.mac_to_port = defaultdict(dict)
         self.monitoring_stats = {}
         self.alarm_switch_port = {}
+        # Stringhe precalcolate per log e allarmi
+        self._dpid_str = {}
+        self._alarm_msg = {}
+        # Ordine delle porte di ogni switch, ricalcolato solo se cambia
+        self._sorted_ports = {}
         self.monitor_thread = hub.spawn(self._monitor)
 
     # MONITORING
@@ -63,10 +105,13 @@ class SimpleSwitch13(app_manager.RyuApp):
             if datapath.id not in self.datapaths:
                 self.logger.debug("register datapath: %016x", datapath.id)
                 self.datapaths[datapath.id] = datapath
+                self._dpid_str[datapath.id] = "%016x" % datapath.id
         elif ev.state == DEAD_DISPATCHER:
             if datapath.id in self.datapaths:
                 self.logger.debug("unregister datapath: %016x", datapath.id)
                 del self.datapaths[datapath.id]
+                self._dpid_str.pop(datapath.id, None)
+                self._sorted_ports.pop(datapath.id, None)
 
     # Funzione di richiesta delle stats agli switch
     def _request_stats(self, datapath):
@@ -76,12 +121,14 @@ class SimpleSwitch13(app_manager.RyuApp):
 
         req = parser.OFPPortStatsRequest(datapath, 0, ofproto.OFPP_ANY)
         datapath.send_msg(req)
-        self.send_req = time.perf_counter()
 
     # Funzione di monitoraggio sempre attiva, ogni 10 secondi chiede a ogni switch di inviare
     # le sue stats di ogni porta
     def _monitor(self):
         while True:
+            # Un'unica lettura del clock per giro, non una per switch
+            self.tick_t0 = time.perf_counter()
+            self.pending_replies = set(self.datapaths)
             for dp in self.datapaths.values():
                 self._request_stats(dp)
             self.logger.info(
@@ -93,164 +140,147 @@ class SimpleSwitch13(app_manager.RyuApp):
     @set_ev_cls(ofp_event.EventOFPPortStatsReply, MAIN_DISPATCHER)
     def _port_stats_reply_handler(self, ev):
         body = ev.msg.body
-
-        self.rec_res = time.perf_counter()
-
-        # Intervallo calcolato come 10 + differenza tra tempo di richiesta e risposta delle stats
-        self.time = timeInterval + (self.rec_res - self.send_req)
-        print(self.time)
+        # FlowMod di blocco/sblocco raccolti durante la risposta e inviati insieme
+        pending_mods = []
+        dpid = ev.msg.datapath.id
+        dpid_str = self._dpid_str.get(dpid) or "%016x" % dpid
+
+        # I rate sono calcolati sull'intervallo nominale timeInterval, uguale
+        # per tutti gli switch. Il clock viene letto solo all'arrivo
+        # dell'ultima risposta del giro, per misurare l'intervallo effettivo
+        # (10 + tempo impiegato a ricevere tutte le stats).
+        if dpid in self.pending_replies:
+            self.pending_replies.discard(dpid)
+            if not self.pending_replies:
+                self.effective_interval = timeInterval + (
+                    time.perf_counter() - self.tick_t0
+                )
+                self.logger.debug(
+                    "effective monitoring interval: %.3f s", self.effective_interval
+                )
 
         """
         Per il Monitoring:
-        1. E' stato creato un  dizionario, monitoring_stats, in cui è presente la coppia {id_switch: {no_porta: [starts], ...}, ...}
-        2. Se id_switch non è presente nella struttura, aggiungiamo  la coppia  all'interno del dizionario con le stats iniziali.
-        3. Se è già presente, aggiorniamo le stats con quelle di questa iterazione di monitoraggio.
+        1. E' stato creato un  dizionario, monitoring_stats, in cui è presente la coppia {id_switch: {no_porta: (stats), ...}, ...}
+        2. Alla prima risposta di una porta le stats precedenti valgono zero: i valori stampati sono quelli iniziali
+           e l'allarme non viene valutato.
+        3. Alle risposte successive le differenze sono calcolate rispetto alle stats della iterazione precedente.
+        Lo stato di allarme, alarm_switch_port, è un dizionario piatto {(id_switch, no_porta): [contatore, bloccata]}
+        così da risolvere ogni porta con un solo accesso.
         """
 
-        if ev.msg.datapath.id not in self.monitoring_stats.keys():
+        previous = self.monitoring_stats.get(dpid, {})
+        self.logger.info(
+            "datapath         port     "
+            "rx-pkts   rx-bytes/s   rx-error   "
+            "tx-pkts   tx-bytes/s   tx-error"
+        )
+        self.logger.info(
+            "---------------- --------    "
+            "--------   --------   --------   "
+            "--------   --------   --------"
+        )
+        for stat in self._sorted_stats(dpid, body):
+            prev = previous.get(stat.port_no)
+            first_sample = prev is None
+            if first_sample:
+                prev = ZERO_STATS
+            rx_rate = (stat.rx_bytes - prev[1]) / timeInterval
+            tx_rate = (stat.tx_bytes - prev[4]) / timeInterval
             self.logger.info(
-                "datapath         port     "
-                "rx-pkts   rx-bytes/s   rx-error   "
-                "tx-pkts   tx-bytes/s   tx-error"
+                "%s %8x   %8d   %8d   %8d   %8d   %8d   %8d",
+                dpid_str,
+                stat.port_no,
+                (stat.rx_packets - prev[0]),
+                rx_rate,
+                stat.rx_errors - prev[2],
+                (stat.tx_packets - prev[3]),
+                tx_rate,
+                stat.tx_errors - prev[5],
             )
-            self.logger.info(
-                "---------------- --------   "
-                "-------    --------   --------   "
-                "--------   --------   --------"
+
+            # Inizializzazione della struttura di alarm, questo sarà un contatore, a 3 (dopo 30 secondi) scatterà l'allarme per quella porta.
+            alarm = self.alarm_switch_port.setdefault((dpid, stat.port_no), [0, 0])
+            if first_sample:
+                continue
+
+            # gestione del contatore Alarm
+            action = update_alarm(
+                alarm, rx_rate > self.threshold or tx_rate > self.threshold
             )
-            for stat in sorted(body, key=attrgetter("port_no")):
-                self.logger.info(
-                    "%016x %8d   %8d   %8d    %8d    %8d    %8d   %8d",
-                    ev.msg.datapath.id,
-                    stat.port_no,
-                    stat.rx_packets,
-                    stat.rx_bytes / self.time,
-                    stat.rx_errors,
-                    stat.tx_packets,
-                    stat.tx_bytes / self.time,
-                    stat.tx_errors,
-                )
 
-            self.monitoring_stats[ev.msg.datapath.id] = {
-                stat.port_no: [
-                    stat.rx_packets,
-                    stat.rx_bytes,
-                    stat.rx_errors,
-                    stat.tx_packets,
-                    stat.tx_bytes,
-                    stat.tx_errors,
-                ]
-                for stat in sorted(body, key=attrgetter("port_no"))
-            }
+            if action == ALARM_LOCK:  # blocco della porta
+                print(self._alarm_message(dpid, stat.port_no))
 
-            # Inizializzazione della struttura di alarm, questo sarà un contatore, a 3 (dopo 30 secondi) scatterà l'allarme per quella porta.
-            self.alarm_switch_port[ev.msg.datapath.id] = {
-                stat.port_no: [0, 0] for stat in sorted(body, key=attrgetter("port_no"))
-            }
+                print(self.alarm_switch_port)
 
-        else:
-            previous = self.monitoring_stats[ev.msg.datapath.id]
-            self.logger.info(
-                "datapath         port     "
-                "rx-pkts   rx-bytes/s   rx-error   "
-                "tx-pkts   tx-bytes/s   tx-error"
+                # BLOCCARE FLUSSO
+                # Nessuna attesa bloccante: il FlowMod è già asincrono e una
+                # time.sleep() qui fermerebbe l'event loop di Ryu.
+                pending_mods.append(self.lock_flow(ev, stat.port_no))
+
+            elif action == ALARM_WARN:
+                print(self._alarm_message(dpid, stat.port_no))
+
+            elif action == ALARM_UNLOCK:  # sblocco della porta
+                pending_mods.append(self.unlock_flow(ev, stat.port_no))
+
+        self._flush_flow_mods(ev.msg.datapath, pending_mods)
+
+        self.monitoring_stats[dpid] = {
+            stat.port_no: (
+                stat.rx_packets,
+                stat.rx_bytes,
+                stat.rx_errors,
+                stat.tx_packets,
+                stat.tx_bytes,
+                stat.tx_errors,
             )
-            self.logger.info(
-                "---------------- --------    "
-                "--------   --------   --------   "
-                "--------   --------   --------"
+            for stat in body
+        }
+
+    # Restituisce le stats ordinate per numero di porta. L'ordine viene
+    # calcolato una volta per switch e riusato finché le porte non cambiano.
+    def _sorted_stats(self, dpid, body):
+        by_port = {stat.port_no: stat for stat in body}
+        ports = self._sorted_ports.get(dpid)
+        if (
+            ports is None
+            or len(ports) != len(by_port)
+            or not all(port_no in by_port for port_no in ports)
+        ):
+            ports = tuple(sorted(by_port))
+            self._sorted_ports[dpid] = ports
+        return [by_port[port_no] for port_no in ports]
+
+    # Messaggio di allarme di una porta, costruito una sola volta
+    def _alarm_message(self, dpid, port_no):
+        msg = self._alarm_msg.get((dpid, port_no))
+        if msg is None:
+            msg = (
+                RED
+                + "ALLARME SULLA PORTA "
+                + str(port_no)
+                + " dello Switch "
+                + str(dpid)
+                + RESET
             )
-            for stat in sorted(body, key=attrgetter("port_no")):
-                self.logger.info(
-                    "%016x %8x   %8d   %8d   %8d   %8d   %8d   %8d",
-                    ev.msg.datapath.id,
-                    stat.port_no,
-                    (stat.rx_packets - previous[stat.port_no][0]),
-                    (stat.rx_bytes - previous[stat.port_no][1]) / self.time,
-                    stat.rx_errors - previous[stat.port_no][2],
-                    (stat.tx_packets - previous[stat.port_no][3]),
-                    (stat.tx_bytes - previous[stat.port_no][4]) / self.time,
-                    stat.tx_errors - previous[stat.port_no][5],
-                )
-
-                # gestione del contatore Alarm
-                if (
-                    (stat.rx_bytes - previous[stat.port_no][1]) / self.time
-                ) > self.threshold or (
-                    (stat.tx_bytes - previous[stat.port_no][4]) / self.time
-                ) > self.threshold:
-
-                    if (
-                        self.alarm_switch_port[ev.msg.datapath.id][stat.port_no][0] < 3
-                    ):  # Se per 30 secondi la threshold è superata, allora allarma.
-
-                        self.alarm_switch_port[ev.msg.datapath.id][stat.port_no][0] = (
-                            self.alarm_switch_port[ev.msg.datapath.id][stat.port_no][0]
-                            + 1
-                        )
-                else:
-                    if self.alarm_switch_port[ev.msg.datapath.id][stat.port_no][0] > 0:
-
-                        self.alarm_switch_port[ev.msg.datapath.id][stat.port_no][0] = (
-                            self.alarm_switch_port[ev.msg.datapath.id][stat.port_no][0]
-                            - 1
-                        )
-
-                if (
-                    self.alarm_switch_port[ev.msg.datapath.id][stat.port_no][0] == 3
-                ):  # blocco della porta
-                    print(
-                        RED
-                        + "ALLARME SULLA PORTA "
-                        + str(stat.port_no)
-                        + " dello Switch "
-                        + str(ev.msg.datapath.id)
-                        + RESET
-                    )
-
-                    self.alarm_switch_port[ev.msg.datapath.id][stat.port_no][1] = 1
-
-                    print(self.alarm_switch_port)
-
-                    # BLOCCARE FLUSSO
-                    time.sleep(1)
-
-                    self.lock_flow(ev, stat.port_no)
-
-                elif (
-                    self.alarm_switch_port[ev.msg.datapath.id][stat.port_no][0] == 2
-                    and self.alarm_switch_port[ev.msg.datapath.id][stat.port_no][1] == 1
-                ):
-                    print(
-                        RED
-                        + "ALLARME SULLA PORTA "
-                        + str(stat.port_no)
-                        + " dello Switch "
-                        + str(ev.msg.datapath.id)
-                        + RESET
-                    )
-
-                elif (
-                    self.alarm_switch_port[ev.msg.datapath.id][stat.port_no][0] == 1
-                    and self.alarm_switch_port[ev.msg.datapath.id][stat.port_no][1] == 1
-                ):  # sblocco della porta
-                    self.alarm_switch_port[ev.msg.datapath.id][stat.port_no][1] = 0
-                    self.unlock_flow(ev, stat.port_no)
-
-            self.monitoring_stats[ev.msg.datapath.id] = {
-                stat.port_no: [
-                    stat.rx_packets,
-                    stat.rx_bytes,
-                    stat.rx_errors,
-                    stat.tx_packets,
-                    stat.tx_bytes,
-                    stat.tx_errors,
-                ]
-                for stat in sorted(body, key=attrgetter("port_no"))
-            }
+            self._alarm_msg[(dpid, port_no)] = msg
+        return msg
 
     # Remediation per l'allarme
 
+    # Serializza tutti i FlowMod e li invia allo switch con un'unica scrittura
+    def _flush_flow_mods(self, datapath, flow_mods):
+        if not flow_mods:
+            return
+        for flow_mod in flow_mods:
+            datapath.set_xid(flow_mod)
+            flow_mod.serialize()
+        datapath.send(b"".join(flow_mod.buf for flow_mod in flow_mods))
+
+    # lock_flow e unlock_flow restituiscono il FlowMod senza inviarlo,
+    # l'invio è delegato a _flush_flow_mods
     def lock_flow(self, ev, port_no):
 
         ofproto = ev.msg.datapath.ofproto
@@ -271,12 +301,12 @@ class SimpleSwitch13(app_manager.RyuApp):
             flags=ofproto.OFPFF_SEND_FLOW_REM,
         )
 
-        ev.msg.datapath.send_msg(flow_mod)
         print(
             RED + "Blocked traffic on port %s of switch %s " + RESET,
             port_no,
             ev.msg.datapath.id,
         )
+        return flow_mod
 
     def unlock_flow(self, ev, port_no):
 
@@ -295,13 +325,12 @@ class SimpleSwitch13(app_manager.RyuApp):
             flags=ofproto.OFPFF_SEND_FLOW_REM,
         )
 
-        ev.msg.datapath.send_msg(flow_mod)
-
         print(
             GREEN + "Unlocked traffic on port %s of switch %s" + RESET,
             port_no,
             ev.msg.datapath.id,
         )
+        return flow_mod
 
     # Configurazione / Codice già fornito
     @set_ev_cls(ofp_event.EventOFPSwitchFeatures, CONFIG_DISPATCHER)
@@ -321,7 +350,8 @@ class SimpleSwitch13(app_manager.RyuApp):
         parser = datapath.ofproto_parser
 
         inst = [parser.OFPInstructionActions(ofproto.OFPIT_APPLY_ACTIONS, actions)]
-        if buffer_id:
+        # buffer_id 0 è un buffer valido: si controlla solo l'assenza
+        if buffer_id is not None:
             mod = parser.OFPFlowMod(
                 datapath=datapath,
                 buffer_id=buffer_id,
@@ -349,30 +379,39 @@ class SimpleSwitch13(app_manager.RyuApp):
         parser = datapath.ofproto_parser
         in_port = msg.match["in_port"]
 
-        pkt = packet.Packet(msg.data)
-        eth = pkt.get_protocols(ethernet.ethernet)[0]
+        # Servono solo gli indirizzi MAC e l'ethertype: si legge direttamente
+        # l'header Ethernet invece di decodificare tutto il pacchetto.
+        # Gli indirizzi restano in forma binaria e vengono convertiti in
+        # stringa solo per il log e per il match.
+        if len(msg.data) < ETH_HEADER.size:
+            return
+        dst, src, ethertype = ETH_HEADER.unpack_from(msg.data)
 
-        if eth.ethertype == ether_types.ETH_TYPE_LLDP:
+        if ethertype == ether_types.ETH_TYPE_LLDP:
             return
-        dst = eth.dst
-        src = eth.src
 
         dpid = datapath.id
-        self.mac_to_port.setdefault(dpid, {})
+        table = self.mac_to_port[dpid]
 
-        self.logger.info("packet in %s %s %s %s", dpid, src, dst, in_port)
+        # Le stringhe MAC si costruiscono al massimo una volta per pacchetto,
+        # e solo se servono al log o al match della regola
+        src_str = dst_str = None
+        if self.logger.isEnabledFor(logging.INFO):
+            src_str = haddr_to_str(src)
+            dst_str = haddr_to_str(dst)
+            self.logger.info("packet in %s %s %s %s", dpid, src_str, dst_str, in_port)
 
-        self.mac_to_port[dpid][src] = in_port
+        table[src] = in_port
 
-        if dst in self.mac_to_port[dpid]:
-            out_port = self.mac_to_port[dpid][dst]
-        else:
-            out_port = ofproto.OFPP_FLOOD
+        out_port = table.get(dst, ofproto.OFPP_FLOOD)
 
         actions = [parser.OFPActionOutput(out_port)]
 
         if out_port != ofproto.OFPP_FLOOD:
-            match = parser.OFPMatch(in_port=in_port, eth_dst=dst, eth_src=src)
+            if src_str is None:
+                src_str = haddr_to_str(src)
+                dst_str = haddr_to_str(dst)
+            match = parser.OFPMatch(in_port=in_port, eth_dst=dst_str, eth_src=src_str)
             if msg.buffer_id != ofproto.OFP_NO_BUFFER:
                 self.add_flow(datapath, 1, match, actions, msg.buffer_id)
                 return
@@ -2,466 +2,488 @@
 """
 Simplified Demonstration of Adaptive Blocking/Unblocking Policy Solution
 
-This script demonstrates how the adaptive blocking system addresses the 
+This script demonstrates how the adaptive blocking system addresses the
 inflexible blocking/unblocking policy flaw.
 """
 
+import functools
 import sys
-import os
-import time
-import random
-import json
-from datetime import datetime, timedelta
-
-# Add the project directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-print("=" * 70)
-print("🔄 ADAPTIVE BLOCKING/UNBLOCKING POLICY DEMONSTRATION")
-print("Addressing the Inflexible Blocking/Unblocking Policy Flaw")
-print("=" * 70)
-
-def demonstrate_problem_analysis():
-    """Demonstrate the problem and solution overview"""
-    print("\n1. PROBLEM ANALYSIS")
-    print("-" * 40)
-    
-    print("\n📋 Original Inflexible Policy Problems:")
-    problems = [
-        "Fixed blocking duration regardless of threat level",
-        "No consideration of user reputation or history", 
-        "Unblocking either too early (allowing attackers back) or too late (blocking legitimate users)",
-        "No adaptive thresholds based on network conditions",
-        "No differentiation between false positives and real threats",
-        "No behavioral analysis for unblocking decisions",
-        "Single blocking strategy for all scenarios"
-    ]
-    
-    for problem in problems:
-        print(f"   ❌ {problem}")
-    
-    print("\n🎯 Adaptive Solution Features:")
-    solutions = [
-        "Dynamic blocking duration based on threat assessment",
-        "Reputation-based scoring system with history tracking",
-        "Behavioral analysis for legitimate user detection", 
-        "Adaptive thresholds based on network conditions",
-        "Graduated response (monitor → rate limit → block)",
-        "Machine learning-based pattern recognition",
-        "False positive detection and automatic mitigation",
-        "Real-time policy adjustment based on feedback"
-    ]
-    
-    for solution in solutions:
-        print(f"   ✅ {solution}")
-
-def demonstrate_threat_assessment():
-    """Demonstrate threat level assessment and dynamic blocking"""
-    print("\n2. THREAT ASSESSMENT & DYNAMIC BLOCKING")
-    print("-" * 50)
-    
-    scenarios = [
-        {
-            "name": "Low Threat - Legitimate User",
-            "traffic": {"packet_rate": 20, "burst_ratio": 0.2, "unique_ports": 3},
-            "reputation": 0.8,
-            "block_duration": "60 seconds",
-            "early_unblock": "Yes (good reputation)"
-        },
-        {
-            "name": "Medium Threat - Suspicious Activity", 
-            "traffic": {"packet_rate": 200, "burst_ratio": 0.6, "unique_ports": 8},
-            "reputation": 0.5,
-            "block_duration": "5 minutes",
-            "early_unblock": "Conditional (behavior analysis)"
-        },
-        {
-            "name": "High Threat - Attack Pattern",
-            "traffic": {"packet_rate": 800, "burst_ratio": 0.9, "unique_ports": 15},
-            "reputation": 0.2,
-            "block_duration": "15 minutes", 
-            "early_unblock": "No (extended monitoring)"
-        },
-        {
-            "name": "Critical Threat - DDoS Attack",
-            "traffic": {"packet_rate": 1500, "burst_ratio": 0.95, "unique_ports": 20},
-            "reputation": 0.1,
-            "block_duration": "1 hour - 24 hours",
-            "early_unblock": "No (maximum duration)"
-        }
-    ]
-    
-    for scenario in scenarios:
-        print(f"\n🔍 Scenario: {scenario['name']}")
-        print(f"   📊 Traffic Pattern: {scenario['traffic']}")
-        print(f"   ⭐ Reputation Score: {scenario['reputation']}")
-        print(f"   ⏱️  Block Duration: {scenario['block_duration']}")
-        print(f"   🔓 Early Unblock: {scenario['early_unblock']}")
-
-def demonstrate_reputation_system():
-    """Demonstrate reputation-based policy adjustment"""
-    print("\n3. REPUTATION SYSTEM DEMONSTRATION") 
-    print("-" * 40)
-    
-    print("\n📊 Reputation Scoring Components:")
-    components = [
-        "Historical behavior (legitimate vs malicious connections)",
-        "False positive rate (system learning from mistakes)",
-        "Connection patterns (consistent vs erratic)",
-        "Traffic characteristics (normal vs abnormal)",
-        "Time-based decay (recent behavior weighted more)"
-    ]
-    
-    for component in components:
-        print(f"   📈 {component}")
-    
-    print("\n🎯 Reputation Impact on Blocking:")
-    
-    reputation_examples = [
-        {"score": 0.9, "status": "High Trust", "effect": "Shorter blocks, early unblock eligibility"},
-        {"score": 0.7, "status": "Good", "effect": "Standard blocks with unblock consideration"},
-        {"score": 0.5, "status": "Neutral", "effect": "Standard blocking policy"},
-        {"score": 0.3, "status": "Poor", "effect": "Extended blocks, stricter monitoring"},
-        {"score": 0.1, "status": "Very Poor", "effect": "Maximum duration blocks, no early unblock"}
-    ]
-    
-    for rep in reputation_examples:
-        print(f"   📊 Score {rep['score']}: {rep['status']} - {rep['effect']}")
-
-def demonstrate_behavioral_analysis():
-    """Demonstrate behavioral pattern analysis"""
-    print("\n4. BEHAVIORAL ANALYSIS")
-    print("-" * 30)
-    
-    print("\n🧠 Pattern Recognition Features:")
-    features = [
-        "Traffic consistency analysis",
-        "Timing pattern recognition", 
-        "Port usage patterns",
-        "Packet size distribution",
-        "Session duration analysis",
-        "Frequency deviation detection"
-    ]
-    
-    for feature in features:
-        print(f"   🔍 {feature}")
-    
-    print("\n📊 Legitimate vs Malicious Patterns:")
-    
-    patterns = {
-        "Legitimate User": {
-            "packet_rate": "Consistent, moderate (10-100 pps)",
-            "timing": "Regular intervals with natural variation",
-            "ports": "Limited set (2-5 common ports)",
-            "sessions": "Normal duration (seconds to minutes)"
-        },
-        "Malicious Actor": {
-            "packet_rate": "High bursts or constant flood (>500 pps)",
-            "timing": "Rapid fire or perfectly regular (bot-like)",
-            "ports": "Port scanning (>10 unique ports)",
-            "sessions": "Very short or very long abnormal durations"
-        }
-    }
-    
-    for user_type, characteristics in patterns.items():
-        print(f"\n   👤 {user_type}:")
-        for aspect, description in characteristics.items():
-            print(f"      📈 {aspect}: {description}")
-
-def demonstrate_adaptive_thresholds():
-    """Demonstrate adaptive threshold adjustment"""
-    print("\n5. ADAPTIVE THRESHOLDS")
-    print("-" * 30)
-    
-    print("\n🎯 Baseline Thresholds:")
-    baseline = {
-        "Low Threat": 0.30,
-        "Medium Threat": 0.60, 
-        "High Threat": 0.80,
-        "Critical Threat": 0.90
-    }
-    
-    for level, threshold in baseline.items():
-        print(f"   📊 {level}: {threshold}")
-    
-    print("\n🔄 Dynamic Adjustments:")
-    
-    conditions = [
-        {
-            "condition": "High Attack Frequency (>70%)",
-            "adjustment": "Lower thresholds (-20%) - more aggressive blocking",
-            "example": "Medium threat: 0.60 → 0.48"
-        },
-        {
-            "condition": "High False Positive Rate (>10%)",
-            "adjustment": "Raise thresholds (+10%) - more conservative blocking", 
-            "example": "Medium threat: 0.60 → 0.66"
-        },
-        {
-            "condition": "Network Congestion (>80% load)",
-            "adjustment": "Lower thresholds (-15%) - protect network resources",
-            "example": "High threat: 0.80 → 0.68"
-        },
-        {
-            "condition": "Quiet Period (<30% activity)",
-            "adjustment": "Raise thresholds (+20%) - allow more traffic",
-            "example": "Low threat: 0.30 → 0.36"
-        }
-    ]
-    
-    for condition in conditions:
-        print(f"\n   🌐 {condition['condition']}")
-        print(f"      🎯 {condition['adjustment']}")
-        print(f"      📊 {condition['example']}")
-
-def demonstrate_unblocking_intelligence():
-    """Demonstrate intelligent unblocking decisions"""
-    print("\n6. INTELLIGENT UNBLOCKING")
-    print("-" * 35)
-    
-    print("\n🔓 Unblocking Decision Factors:")
-    factors = [
-        "Time elapsed vs initial duration",
-        "Current reputation score",
-        "Behavioral pattern analysis",
-        "False positive likelihood",
-        "Network condition changes",
-        "Admin override requests"
-    ]
-    
-    for factor in factors:
-        print(f"   📊 {factor}")
-    
-    print("\n⚡ Early Unblocking Scenarios:")
-    scenarios = [
-        {
-            "trigger": "False Positive Detection",
-            "condition": "High reputation + legitimate patterns observed",
-            "action": "Immediate unblock + reputation boost"
-        },
-        {
-            "trigger": "Behavioral Improvement", 
-            "condition": "Attack patterns stopped + normal behavior resumed",
-            "action": "Gradual unblock (monitor → allow)"
-        },
-        {
-            "trigger": "Network Recovery",
-            "condition": "Attack subsided + normal network conditions",
-            "action": "Progressive unblocking of medium-threat IPs"
-        },
-        {
-            "trigger": "Admin Intervention",
-            "condition": "Manual override by administrator",
-            "action": "Immediate unblock + policy adjustment"
-        }
-    ]
-    
-    for scenario in scenarios:
-        print(f"\n   🎯 {scenario['trigger']}:")
-        print(f"      📋 Condition: {scenario['condition']}")
-        print(f"      🔄 Action: {scenario['action']}")
-
-def demonstrate_graduated_response():
-    """Demonstrate graduated response system"""
-    print("\n7. GRADUATED RESPONSE SYSTEM")
-    print("-" * 40)
-    
-    print("\n📊 Response Escalation Levels:")
-    
-    levels = [
-        {
-            "level": "1. Monitor",
-            "description": "Track behavior, collect data, no blocking",
-            "trigger": "Slight deviation from normal (score: 0.3-0.4)",
-            "duration": "Continuous"
-        },
-        {
-            "level": "2. Rate Limit",
-            "description": "Reduce allowed traffic rate, maintain connectivity",
-            "trigger": "Moderate suspicious activity (score: 0.4-0.6)", 
-            "duration": "1-5 minutes"
-        },
-        {
-            "level": "3. Selective Block",
-            "description": "Block specific flows/ports, allow others",
-            "trigger": "Clear threat patterns (score: 0.6-0.8)",
-            "duration": "5-15 minutes"
-        },
-        {
-            "level": "4. Full Block",
-            "description": "Complete traffic blocking",
-            "trigger": "High threat/attack confirmed (score: >0.8)",
-            "duration": "15 minutes - 24 hours"
-        }
-    ]
-    
-    for level in levels:
-        print(f"\n   {level['level']}:")
-        print(f"      📝 {level['description']}")
-        print(f"      🎯 Trigger: {level['trigger']}")
-        print(f"      ⏱️  Duration: {level['duration']}")
-
-def demonstrate_comparison():
-    """Demonstrate comparison with inflexible system"""
-    print("\n8. COMPARISON: INFLEXIBLE vs ADAPTIVE")
-    print("-" * 45)
-    
-    comparisons = [
-        {
-            "aspect": "Blocking Duration",
-            "inflexible": "Fixed 5 minutes for all threats",
-            "adaptive": "Dynamic: 60s (low) to 24h (critical)",
-            "benefit": "Appropriate response to threat level"
-        },
-        {
-            "aspect": "False Positive Handling",
-            "inflexible": "No detection or correction mechanism",
-            "adaptive": "Automatic detection + reputation adjustment",
-            "benefit": "System learns and improves over time"
-        },
-        {
-            "aspect": "Legitimate User Impact",
-            "inflexible": "Fixed blocks regardless of user history",
-            "adaptive": "Shorter blocks for trusted users",
-            "benefit": "Reduced disruption to legitimate traffic"
-        },
-        {
-            "aspect": "Attack Response",
-            "inflexible": "Same response to all attack types",
-            "adaptive": "Escalated response based on threat severity",
-            "benefit": "More effective attack mitigation"
-        },
-        {
-            "aspect": "Network Adaptation",
-            "inflexible": "Static thresholds regardless of conditions",
-            "adaptive": "Dynamic thresholds based on network state",
-            "benefit": "Optimal performance under varying conditions"
-        }
-    ]
-    
-    for comp in comparisons:
-        print(f"\n📊 {comp['aspect']}:")
-        print(f"   ❌ Inflexible: {comp['inflexible']}")
-        print(f"   ✅ Adaptive: {comp['adaptive']}")
-        print(f"   💡 Benefit: {comp['benefit']}")
-
-def demonstrate_integration():
-    """Demonstrate system integration capabilities"""
-    print("\n9. SYSTEM INTEGRATION")
-    print("-" * 25)
-    
-    print("\n🔗 Integration Points:")
-    integrations = [
-        "Modular Controller (blocking decisions)",
-        "Enhanced Mitigation Enforcer (flow-level control)",
-        "External Policy System (admin overrides)",
-        "Complex Topology (distributed scenarios)",
-        "Network Monitoring (real-time conditions)",
-        "Machine Learning Pipeline (pattern recognition)"
-    ]
-    
-    for integration in integrations:
-        print(f"   🔌 {integration}")
-    
-    print("\n📊 System Benefits:")
-    benefits = [
-        "Seamless integration with existing architecture",
-        "Backward compatibility with current policies",
-        "Real-time adaptation to network conditions",
-        "Comprehensive logging and monitoring",
-        "Admin control and override capabilities",
-        "Machine learning-enhanced decision making"
-    ]
-    
-    for benefit in benefits:
-        print(f"   ✅ {benefit}")
-
-def demonstrate_use_cases():
-    """Demonstrate real-world use cases"""
-    print("\n10. REAL-WORLD USE CASES")
-    print("-" * 30)
-    
-    use_cases = [
-        {
-            "scenario": "Enterprise Network Protection",
-            "challenge": "Distinguish between legitimate high-traffic users and attackers",
-            "solution": "Reputation-based blocking with behavioral analysis",
-            "outcome": "Reduced false positives by 80%, maintained security"
-        },
-        {
-            "scenario": "DDoS Attack Mitigation", 
-            "challenge": "Rapidly escalating distributed attack",
-            "solution": "Adaptive thresholds with graduated response",
-            "outcome": "Faster attack detection, progressive mitigation"
-        },
-        {
-            "scenario": "VIP User Protection",
-            "challenge": "Critical users accidentally blocked during attacks",
-            "solution": "Reputation whitelist with behavior verification",
-            "outcome": "Zero downtime for critical business users"
-        },
-        {
-            "scenario": "IoT Device Management",
-            "challenge": "Legitimate IoT devices with unusual traffic patterns",
-            "solution": "Device-specific behavioral profiles",
-            "outcome": "Accurate IoT device identification and protection"
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+# Demo content. These are constants, built once at import time and rendered
+# by render_demo() from the section table below.
+_PROBLEMS = (
+    "Fixed blocking duration regardless of threat level",
+    "No consideration of user reputation or history",
+    "Unblocking either too early (allowing attackers back) or too late (blocking legitimate users)",
+    "No adaptive thresholds based on network conditions",
+    "No differentiation between false positives and real threats",
+    "No behavioral analysis for unblocking decisions",
+    "Single blocking strategy for all scenarios",
+)
+
+_SOLUTIONS = (
+    "Dynamic blocking duration based on threat assessment",
+    "Reputation-based scoring system with history tracking",
+    "Behavioral analysis for legitimate user detection",
+    "Adaptive thresholds based on network conditions",
+    "Graduated response (monitor → rate limit → block)",
+    "Machine learning-based pattern recognition",
+    "False positive detection and automatic mitigation",
+    "Real-time policy adjustment based on feedback",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ThreatScenario:
+    """One row of the threat assessment table"""
+    name: str
+    packet_rate: int
+    burst_ratio: float
+    unique_ports: int
+    reputation: float
+    block_duration: str
+    early_unblock: str
+
+    @property
+    def traffic(self) -> Dict[str, float]:
+        """Traffic pattern as shown in the demo"""
+        return {
+            "packet_rate": self.packet_rate,
+            "burst_ratio": self.burst_ratio,
+            "unique_ports": self.unique_ports,
         }
-    ]
-    
-    for use_case in use_cases:
-        print(f"\n🎯 {use_case['scenario']}:")
-        print(f"   ❓ Challenge: {use_case['challenge']}")
-        print(f"   💡 Solution: {use_case['solution']}")
-        print(f"   ✅ Outcome: {use_case['outcome']}")
-
-def main():
+
+
+_THREAT_SCENARIOS = (
+    ThreatScenario("Low Threat - Legitimate User", 20, 0.2, 3,
+                   0.8, "60 seconds", "Yes (good reputation)"),
+    ThreatScenario("Medium Threat - Suspicious Activity", 200, 0.6, 8,
+                   0.5, "5 minutes", "Conditional (behavior analysis)"),
+    ThreatScenario("High Threat - Attack Pattern", 800, 0.9, 15,
+                   0.2, "15 minutes", "No (extended monitoring)"),
+    ThreatScenario("Critical Threat - DDoS Attack", 1500, 0.95, 20,
+                   0.1, "1 hour - 24 hours", "No (maximum duration)"),
+)
+
+_REPUTATION_COMPONENTS = (
+    "Historical behavior (legitimate vs malicious connections)",
+    "False positive rate (system learning from mistakes)",
+    "Connection patterns (consistent vs erratic)",
+    "Traffic characteristics (normal vs abnormal)",
+    "Time-based decay (recent behavior weighted more)",
+)
+
+# (score, status, effect)
+_REPUTATION_EXAMPLES = (
+    (0.9, "High Trust", "Shorter blocks, early unblock eligibility"),
+    (0.7, "Good", "Standard blocks with unblock consideration"),
+    (0.5, "Neutral", "Standard blocking policy"),
+    (0.3, "Poor", "Extended blocks, stricter monitoring"),
+    (0.1, "Very Poor", "Maximum duration blocks, no early unblock"),
+)
+
+_PATTERN_FEATURES = (
+    "Traffic consistency analysis",
+    "Timing pattern recognition",
+    "Port usage patterns",
+    "Packet size distribution",
+    "Session duration analysis",
+    "Frequency deviation detection",
+)
+
+# (user type, ((aspect, description), ...))
+_BEHAVIOR_PATTERNS = (
+    ("Legitimate User", (
+        ("packet_rate", "Consistent, moderate (10-100 pps)"),
+        ("timing", "Regular intervals with natural variation"),
+        ("ports", "Limited set (2-5 common ports)"),
+        ("sessions", "Normal duration (seconds to minutes)"),
+    )),
+    ("Malicious Actor", (
+        ("packet_rate", "High bursts or constant flood (>500 pps)"),
+        ("timing", "Rapid fire or perfectly regular (bot-like)"),
+        ("ports", "Port scanning (>10 unique ports)"),
+        ("sessions", "Very short or very long abnormal durations"),
+    )),
+)
+
+# Threshold table stored column-wise: level names and baseline values are
+# parallel tuples indexed by threat level, so adjustments are computed over
+# the numeric column directly.
+_THRESHOLD_LEVELS = ("Low Threat", "Medium Threat", "High Threat", "Critical Threat")
+_BASELINE_THRESHOLDS = (0.30, 0.60, 0.80, 0.90)
+_LOW, _MEDIUM, _HIGH, _CRITICAL = range(len(_THRESHOLD_LEVELS))
+
+# (condition, relative threshold change, rationale, level shown as example)
+_THRESHOLD_CONDITIONS = (
+    ("High Attack Frequency (>70%)", -0.20, "more aggressive blocking", _MEDIUM),
+    ("High False Positive Rate (>10%)", +0.10, "more conservative blocking", _MEDIUM),
+    ("Network Congestion (>80% load)", -0.15, "protect network resources", _HIGH),
+    ("Quiet Period (<30% activity)", +0.20, "allow more traffic", _LOW),
+)
+
+# Normalised traffic entropy H_norm sampled over consecutive monitoring
+# intervals: steady traffic, a burst, then recovery. Smoothed with an EWMA
+# so a single noisy interval does not move the thresholds on its own.
+_EWMA_ALPHA = 0.3
+_ENTROPY_HISTORY = (0.42, 0.45, 0.40, 0.71, 0.88, 0.93, 0.60, 0.44)
+
+_UNBLOCK_FACTORS = (
+    "Time elapsed vs initial duration",
+    "Current reputation score",
+    "Behavioral pattern analysis",
+    "False positive likelihood",
+    "Network condition changes",
+    "Admin override requests",
+)
+
+# (trigger, condition, action)
+_UNBLOCK_SCENARIOS = (
+    ("False Positive Detection",
+     "High reputation + legitimate patterns observed",
+     "Immediate unblock + reputation boost"),
+    ("Behavioral Improvement",
+     "Attack patterns stopped + normal behavior resumed",
+     "Gradual unblock (monitor → allow)"),
+    ("Network Recovery",
+     "Attack subsided + normal network conditions",
+     "Progressive unblocking of medium-threat IPs"),
+    ("Admin Intervention",
+     "Manual override by administrator",
+     "Immediate unblock + policy adjustment"),
+)
+
+# (level, description, trigger, duration)
+_RESPONSE_LEVELS = (
+    ("1. Monitor",
+     "Track behavior, collect data, no blocking",
+     "Slight deviation from normal (score: 0.3-0.4)",
+     "Continuous"),
+    ("2. Rate Limit",
+     "Reduce allowed traffic rate, maintain connectivity",
+     "Moderate suspicious activity (score: 0.4-0.6)",
+     "1-5 minutes"),
+    ("3. Selective Block",
+     "Block specific flows/ports, allow others",
+     "Clear threat patterns (score: 0.6-0.8)",
+     "5-15 minutes"),
+    ("4. Full Block",
+     "Complete traffic blocking",
+     "High threat/attack confirmed (score: >0.8)",
+     "15 minutes - 24 hours"),
+)
+
+# (aspect, inflexible, adaptive, benefit)
+_COMPARISONS = (
+    ("Blocking Duration",
+     "Fixed 5 minutes for all threats",
+     "Dynamic: 60s (low) to 24h (critical)",
+     "Appropriate response to threat level"),
+    ("False Positive Handling",
+     "No detection or correction mechanism",
+     "Automatic detection + reputation adjustment",
+     "System learns and improves over time"),
+    ("Legitimate User Impact",
+     "Fixed blocks regardless of user history",
+     "Shorter blocks for trusted users",
+     "Reduced disruption to legitimate traffic"),
+    ("Attack Response",
+     "Same response to all attack types",
+     "Escalated response based on threat severity",
+     "More effective attack mitigation"),
+    ("Network Adaptation",
+     "Static thresholds regardless of conditions",
+     "Dynamic thresholds based on network state",
+     "Optimal performance under varying conditions"),
+)
+
+_INTEGRATIONS = (
+    "Modular Controller (blocking decisions)",
+    "Enhanced Mitigation Enforcer (flow-level control)",
+    "External Policy System (admin overrides)",
+    "Complex Topology (distributed scenarios)",
+    "Network Monitoring (real-time conditions)",
+    "Machine Learning Pipeline (pattern recognition)",
+)
+
+_INTEGRATION_BENEFITS = (
+    "Seamless integration with existing architecture",
+    "Backward compatibility with current policies",
+    "Real-time adaptation to network conditions",
+    "Comprehensive logging and monitoring",
+    "Admin control and override capabilities",
+    "Machine learning-enhanced decision making",
+)
+
+# (scenario, challenge, solution, outcome)
+_USE_CASES = (
+    ("Enterprise Network Protection",
+     "Distinguish between legitimate high-traffic users and attackers",
+     "Reputation-based blocking with behavioral analysis",
+     "Reduced false positives by 80%, maintained security"),
+    ("DDoS Attack Mitigation",
+     "Rapidly escalating distributed attack",
+     "Adaptive thresholds with graduated response",
+     "Faster attack detection, progressive mitigation"),
+    ("VIP User Protection",
+     "Critical users accidentally blocked during attacks",
+     "Reputation whitelist with behavior verification",
+     "Zero downtime for critical business users"),
+    ("IoT Device Management",
+     "Legitimate IoT devices with unusual traffic patterns",
+     "Device-specific behavioral profiles",
+     "Accurate IoT device identification and protection"),
+)
+
+_ACHIEVEMENTS = (
+    "Dynamic blocking duration based on threat assessment",
+    "Reputation-based policy adjustment with learning",
+    "Behavioral analysis for legitimate user detection",
+    "Adaptive thresholds responding to network conditions",
+    "False positive detection and automatic mitigation",
+    "Graduated response system (monitor → limit → block)",
+    "Real-time policy adjustment and feedback loops",
+    "Seamless integration with existing architecture",
+)
+
+# Banner and section rules, built once
+_BAR = "=" * 70
+_SEP = {width: "-" * width for width in (25, 30, 35, 40, 45, 50)}
+_BANNER = "\n".join((
+    _BAR,
+    "🔄 ADAPTIVE BLOCKING/UNBLOCKING POLICY DEMONSTRATION",
+    "Addressing the Inflexible Blocking/Unblocking Policy Flaw",
+    _BAR,
+))
+
+# Bullet prefixes shared by all the bulleted lists
+_X = "   ❌ "
+_OK = "   ✅ "
+_TREND = "   📈 "
+_SEARCH = "   🔍 "
+_INFO = "   📊 "
+_PLUG = "   🔌 "
+_TGT = "   🎯 "
+
+# Templates for the multi-line records, one %-format per record
+_SCENARIO_TMPL = (
+    "\n🔍 Scenario: %s\n"
+    "   📊 Traffic Pattern: %s\n"
+    "   ⭐ Reputation Score: %s\n"
+    "   ⏱️  Block Duration: %s\n"
+    "   🔓 Early Unblock: %s"
+)
+_SCENARIO_FIELDS = attrgetter(
+    "name", "traffic", "reputation", "block_duration", "early_unblock"
+)
+_UNBLOCK_TMPL = (
+    "\n   🎯 %s:\n"
+    "      📋 Condition: %s\n"
+    "      🔄 Action: %s"
+)
+_RESPONSE_TMPL = (
+    "\n   %s:\n"
+    "      📝 %s\n"
+    "      🎯 Trigger: %s\n"
+    "      ⏱️  Duration: %s"
+)
+_COMPARISON_TMPL = (
+    "\n📊 %s:\n"
+    "   ❌ Inflexible: %s\n"
+    "   ✅ Adaptive: %s\n"
+    "   💡 Benefit: %s"
+)
+_USE_CASE_TMPL = (
+    "\n🎯 %s:\n"
+    "   ❓ Challenge: %s\n"
+    "   💡 Solution: %s\n"
+    "   ✅ Outcome: %s"
+)
+
+_THRESHOLD_TMPL = (
+    "\n   🌐 %s\n"
+    "      🎯 %s thresholds (%+.0f%%) - %s\n"
+    "      📊 %s: %.2f → %.2f"
+)
+
+
+def adjust_thresholds(change: float) -> Tuple[float, ...]:
+    """Apply a relative change to every baseline threshold"""
+    factor = 1 + change
+    return tuple(threshold * factor for threshold in _BASELINE_THRESHOLDS)
+
+
+def ewma(values: Sequence[float], alpha: float) -> Tuple[float, ...]:
+    """Exponentially weighted moving average of a series
+
+    EWMA^k = alpha * H^k + (1 - alpha) * EWMA^(k-1), seeded with the first
+    value. Returns one smoothed value per input value.
+    """
+    smoothed: List[float] = []
+    current: Union[float, None] = None
+    for value in values:
+        current = value if current is None else alpha * value + (1 - alpha) * current
+        smoothed.append(current)
+    return tuple(smoothed)
+
+
+def _ewma_rows() -> Tuple[Tuple[int, float, float], ...]:
+    """Rows of (interval, H_norm, EWMA) for the entropy history"""
+    return tuple(
+        (interval, value, smoothed)
+        for interval, (value, smoothed) in enumerate(
+            zip(_ENTROPY_HISTORY, ewma(_ENTROPY_HISTORY, _EWMA_ALPHA)), start=1
+        )
+    )
+
+
+def _threshold_rows() -> Tuple[tuple, ...]:
+    """Rows for _THRESHOLD_TMPL, with examples computed from the baseline"""
+    rows: List[tuple] = []
+    for condition, change, rationale, level in _THRESHOLD_CONDITIONS:
+        rows.append((
+            condition,
+            "Lower" if change < 0 else "Raise",
+            change * 100,
+            rationale,
+            _THRESHOLD_LEVELS[level].capitalize(),
+            _BASELINE_THRESHOLDS[level],
+            adjust_thresholds(change)[level],
+        ))
+    return tuple(rows)
+
+
+def _bullets(prefix: str, items: Iterable[str]) -> str:
+    """Render a bulleted list with a single join"""
+    return prefix + ("\n" + prefix).join(items)
+
+
+# A demo block: a literal string or a (template, rows) pair
+Block = Union[str, Tuple[str, Sequence[tuple]]]
+
+# The whole demo as data. Each section is (title, rule width, blocks); a block
+# is either a literal string (plain bulleted lists are pre-joined with
+# _bullets) or a (template, rows) pair rendered one row per line.
+# render_demo() is the only code that turns this into text.
+_SECTIONS = (
+    ("1. PROBLEM ANALYSIS", 40, (
+        "\n📋 Original Inflexible Policy Problems:",
+        _bullets(_X, _PROBLEMS),
+        "\n🎯 Adaptive Solution Features:",
+        _bullets(_OK, _SOLUTIONS),
+    )),
+    ("2. THREAT ASSESSMENT & DYNAMIC BLOCKING", 50, (
+        (_SCENARIO_TMPL, tuple(map(_SCENARIO_FIELDS, _THREAT_SCENARIOS))),
+    )),
+    ("3. REPUTATION SYSTEM DEMONSTRATION", 40, (
+        "\n📊 Reputation Scoring Components:",
+        _bullets(_TREND, _REPUTATION_COMPONENTS),
+        "\n🎯 Reputation Impact on Blocking:",
+        (_INFO + "Score %s: %s - %s", _REPUTATION_EXAMPLES),
+    )),
+    ("4. BEHAVIORAL ANALYSIS", 30, (
+        "\n🧠 Pattern Recognition Features:",
+        _bullets(_SEARCH, _PATTERN_FEATURES),
+        "\n📊 Legitimate vs Malicious Patterns:",
+    ) + tuple(
+        block
+        for user_type, characteristics in _BEHAVIOR_PATTERNS
+        for block in ("\n   👤 %s:" % user_type, ("      📈 %s: %s", characteristics))
+    )),
+    ("5. ADAPTIVE THRESHOLDS", 30, (
+        "\n🎯 Baseline Thresholds:",
+        (_INFO + "%s: %s", tuple(zip(_THRESHOLD_LEVELS, _BASELINE_THRESHOLDS))),
+        "\n🔄 Dynamic Adjustments:",
+        (_THRESHOLD_TMPL, _threshold_rows()),
+        "\n📉 EWMA Smoothing of Traffic Entropy (α = %s):" % _EWMA_ALPHA,
+        (_INFO + "Interval %d: H_norm %.2f → EWMA %.3f", _ewma_rows()),
+    )),
+    ("6. INTELLIGENT UNBLOCKING", 35, (
+        "\n🔓 Unblocking Decision Factors:",
+        _bullets(_INFO, _UNBLOCK_FACTORS),
+        "\n⚡ Early Unblocking Scenarios:",
+        (_UNBLOCK_TMPL, _UNBLOCK_SCENARIOS),
+    )),
+    ("7. GRADUATED RESPONSE SYSTEM", 40, (
+        "\n📊 Response Escalation Levels:",
+        (_RESPONSE_TMPL, _RESPONSE_LEVELS),
+    )),
+    ("8. COMPARISON: INFLEXIBLE vs ADAPTIVE", 45, (
+        (_COMPARISON_TMPL, _COMPARISONS),
+    )),
+    ("9. SYSTEM INTEGRATION", 25, (
+        "\n🔗 Integration Points:",
+        _bullets(_PLUG, _INTEGRATIONS),
+        "\n📊 System Benefits:",
+        _bullets(_OK, _INTEGRATION_BENEFITS),
+    )),
+    ("10. REAL-WORLD USE CASES", 30, (
+        (_USE_CASE_TMPL, _USE_CASES),
+    )),
+)
+
+_SUMMARY = (
+    "\n" + _BAR,
+    "🎉 ADAPTIVE BLOCKING DEMONSTRATION COMPLETE",
+    _BAR,
+    "\n✅ KEY ACHIEVEMENTS:",
+    _bullets(_TGT, _ACHIEVEMENTS),
+    "\n🚀 INFLEXIBLE BLOCKING/UNBLOCKING POLICY FLAW RESOLVED!",
+    "\n📊 Solution Benefits:",
+    "   • 80% reduction in false positive blocks",
+    "   • 60% improvement in legitimate user experience",
+    "   • 40% faster attack detection and response",
+    "   • 90% reduction in admin intervention required",
+    "   • 100% compatibility with existing system",
+    "\n🎯 The system now provides intelligent, context-aware blocking",
+    "   decisions that adapt to network conditions and user behavior!",
+)
+
+
+def _render_blocks(parts: List[str], blocks: Sequence[Block]) -> None:
+    """Append the lines of each block to parts"""
+    for block in blocks:
+        if isinstance(block, str):
+            parts.append(block)
+        else:
+            template, rows = block
+            parts.extend(map(template.__mod__, rows))
+
+
+@functools.lru_cache(maxsize=None)
+def render_demo() -> str:
+    """Render the full demonstration text; the result is cached"""
+    parts: List[str] = [_BANNER]
+    for title, width, blocks in _SECTIONS:
+        parts.append("\n" + title)
+        parts.append(_SEP[width])
+        _render_blocks(parts, blocks)
+    _render_blocks(parts, _SUMMARY)
+    return "\n".join(parts) + "\n"
+
+
+@functools.lru_cache(maxsize=None)
+def render_demo_bytes() -> bytes:
+    """UTF-8 encoded render_demo(), cached"""
+    return render_demo().encode("utf-8")
+
+
+def main() -> None:
     """Main demonstration function"""
-    try:
-        demonstrate_problem_analysis()
-        demonstrate_threat_assessment()
-        demonstrate_reputation_system()
-        demonstrate_behavioral_analysis()
-        demonstrate_adaptive_thresholds()
-        demonstrate_unblocking_intelligence()
-        demonstrate_graduated_response()
-        demonstrate_comparison()
-        demonstrate_integration()
-        demonstrate_use_cases()
-        
-        print("\n" + "=" * 70)
-        print("🎉 ADAPTIVE BLOCKING DEMONSTRATION COMPLETE")
-        print("=" * 70)
-        
-        print("\n✅ KEY ACHIEVEMENTS:")
-        achievements = [
-            "Dynamic blocking duration based on threat assessment",
-            "Reputation-based policy adjustment with learning",
-            "Behavioral analysis for legitimate user detection",
-            "Adaptive thresholds responding to network conditions", 
-            "False positive detection and automatic mitigation",
-            "Graduated response system (monitor → limit → block)",
-            "Real-time policy adjustment and feedback loops",
-            "Seamless integration with existing architecture"
-        ]
-        
-        for achievement in achievements:
-            print(f"   🎯 {achievement}")
-        
-        print("\n🚀 INFLEXIBLE BLOCKING/UNBLOCKING POLICY FLAW RESOLVED!")
-        print("\n📊 Solution Benefits:")
-        print("   • 80% reduction in false positive blocks")
-        print("   • 60% improvement in legitimate user experience")
-        print("   • 40% faster attack detection and response")
-        print("   • 90% reduction in admin intervention required")
-        print("   • 100% compatibility with existing system")
-        
-        print("\n🎯 The system now provides intelligent, context-aware blocking")
-        print("   decisions that adapt to network conditions and user behavior!")
-        
-    except Exception as e:
-        print(f"❌ Error during demonstration: {e}")
-        import traceback
-        traceback.print_exc()
+    # Write the pre-encoded bytes straight to the binary stdout buffer,
+    # skipping the text layer. Fall back to a text write when stdout has
+    # been replaced by an object without a buffer (e.g. StringIO).
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        sys.stdout.write(render_demo())
+        return
+    sys.stdout.flush()
+    out.write(render_demo_bytes())
+    out.flush()
+
 
 if __name__ == "__main__":
     main()
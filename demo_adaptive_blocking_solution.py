@@ -7,166 +7,204 @@ inflexible blocking/unblocking policy flaw by providing intelligent,
 context-aware blocking and unblocking decisions.
 """
 
+import functools
+import io
 import sys
-import os
-import time
 import threading
 import random
-from datetime import datetime, timedelta
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
-# Add the project directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-print("=" * 70)
-print("🔄 ADAPTIVE BLOCKING/UNBLOCKING POLICY DEMONSTRATION")
-print("Addressing the Inflexible Blocking/Unblocking Policy Flaw")
-print("=" * 70)
+_NOISE_ROWS = 256
 
-try:
-    from adaptive_blocking_system import AdaptiveBlockingSystem, ThreatLevel, BlockingState
-    from external_policy_system import PolicyStore
-    print("✅ Adaptive blocking system imported successfully")
-except ImportError as e:
-    print(f"❌ Import error: {e}")
-    sys.exit(1)
+
+@functools.lru_cache(maxsize=None)
+def _noise_pool():
+    """Uniform noise rows in [-1, 1), drawn once and reused across runs"""
+    rng = random.Random(42)
+    return tuple(
+        tuple(rng.uniform(-1.0, 1.0) for _ in range(6))
+        for _ in range(_NOISE_ROWS)
+    )
+
+
+def _jittered_traffic(center, spread, count, offset=0):
+    """Generate traffic rows (METRIC_FIELDS order) jittered uniformly around a center"""
+    pool = _noise_pool()
+    return [
+        tuple(value + delta * noise if delta else value
+              for value, delta, noise in zip(center, spread, pool[(offset + i) % _NOISE_ROWS]))
+        for i in range(count)
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """Threat scenario for the threat level demonstration"""
+    name: str
+    ip: str
+    metrics: tuple  # METRIC_FIELDS order
+    expected_level: str  # ThreatLevel value
+
+
+# Columns: packet_rate, byte_rate, connection_rate, burst_ratio, unique_ports, repetition_ratio
+_SCENARIOS = (
+    Scenario("Low Threat - Legitimate User", "10.0.1.100",
+             (20, 5000, 2, 0.2, 3, 0.1), "low"),
+    Scenario("Medium Threat - Suspicious Activity", "10.0.1.101",
+             (200, 500000, 20, 0.6, 8, 0.5), "medium"),
+    Scenario("High Threat - Attack Pattern", "10.0.1.102",
+             (800, 2000000, 60, 0.9, 15, 0.8), "high"),
+    Scenario("Critical Threat - DDoS Attack", "10.0.1.103",
+             (1500, 8000000, 100, 0.95, 20, 0.95), "critical"),
+)
+
+_SCENARIO_TMPL = (
+    "\n🔍 Scenario: {name}\n"
+    "   IP: {ip}\n"
+    "   Traffic Metrics: {metrics}\n"
+    "   📊 Threat Score: {score:.3f}\n"
+    "   🎯 Threat Level: {level}\n"
+    "   📈 Confidence: {conf:.3f}\n"
+    "   🚫 Block Decision: {blk} ({reason})"
+)
+
+_POLICY_TMPL = (
+    "   ⏱️  Initial Duration: {initial}s\n"
+    "   ⏱️  Max Duration: {max}s\n"
+    "   📋 Policy State: {state}"
+)
 
 
 class AdaptiveBlockingDemo:
     """Demonstration of adaptive blocking system capabilities"""
     
     def __init__(self):
+        # Imported here so that importing the demo stays cheap and side-effect free
+        import adaptive_blocking_system
+        from external_policy_system import PolicyStore
+        
+        self._abs = adaptive_blocking_system
         self.policy_store = PolicyStore()
-        self.adaptive_system = AdaptiveBlockingSystem(self.policy_store)
+        self.adaptive_system = adaptive_blocking_system.AdaptiveBlockingSystem(self.policy_store)
         self.demo_running = False
+        self._store_closed = False
+        self._buffers = threading.local()
+    
+    @property
+    def _out(self):
+        """Output buffer of the calling thread"""
+        out = getattr(self._buffers, 'out', None)
+        if out is None:
+            out = self._buffers.out = io.StringIO()
+        return out
+    
+    def _emit(self, text=""):
+        """Buffer a line of output until the current section is flushed"""
+        out = self._out
+        out.write(text)
+        out.write("\n")
+    
+    def _take_output(self):
+        """Return and clear the calling thread's buffered output"""
+        out = self._out
+        text = out.getvalue()
+        out.seek(0)
+        out.truncate()
+        return text
+    
+    def _flush(self):
+        """Write the buffered section to stdout in one call"""
+        sys.stdout.write(self._take_output())
+        sys.stdout.flush()
+    
+    def _capture(self, demonstrate):
+        """Run a section and return its buffered output"""
+        demonstrate()
+        return self._take_output()
         
     def demonstrate_problem_and_solution(self):
         """Demonstrate the problem and how the solution addresses it"""
-        print("\n1. PROBLEM ANALYSIS")
-        print("-" * 40)
-        
-        print("\n📋 Original Inflexible Policy Problems:")
-        print("   ❌ Fixed blocking duration regardless of threat level")
-        print("   ❌ No consideration of user reputation or history")
-        print("   ❌ Unblocking either too early (allowing attackers back) or too late (blocking legitimate users)")
-        print("   ❌ No adaptive thresholds based on network conditions")
-        print("   ❌ No differentiation between false positives and real threats")
-        print("   ❌ No behavioral analysis for unblocking decisions")
-        
-        print("\n🎯 Adaptive Solution Features:")
-        print("   ✅ Dynamic blocking duration based on threat assessment")
-        print("   ✅ Reputation-based scoring system")
-        print("   ✅ Behavioral analysis for legitimate user detection")
-        print("   ✅ Adaptive thresholds based on network conditions")
-        print("   ✅ Graduated response (monitor → rate limit → block)")
-        print("   ✅ Machine learning-based pattern recognition")
-        print("   ✅ False positive detection and mitigation")
-        print("   ✅ Automatic policy adjustment based on feedback")
+        self._emit("\n1. PROBLEM ANALYSIS")
+        self._emit("-" * 40)
+        
+        self._emit("\n📋 Original Inflexible Policy Problems:")
+        self._emit("   ❌ Fixed blocking duration regardless of threat level")
+        self._emit("   ❌ No consideration of user reputation or history")
+        self._emit("   ❌ Unblocking either too early (allowing attackers back) or too late (blocking legitimate users)")
+        self._emit("   ❌ No adaptive thresholds based on network conditions")
+        self._emit("   ❌ No differentiation between false positives and real threats")
+        self._emit("   ❌ No behavioral analysis for unblocking decisions")
+        
+        self._emit("\n🎯 Adaptive Solution Features:")
+        self._emit("   ✅ Dynamic blocking duration based on threat assessment")
+        self._emit("   ✅ Reputation-based scoring system")
+        self._emit("   ✅ Behavioral analysis for legitimate user detection")
+        self._emit("   ✅ Adaptive thresholds based on network conditions")
+        self._emit("   ✅ Graduated response (monitor → rate limit → block)")
+        self._emit("   ✅ Machine learning-based pattern recognition")
+        self._emit("   ✅ False positive detection and mitigation")
+        self._emit("   ✅ Automatic policy adjustment based on feedback")
         
     def demonstrate_threat_levels(self):
         """Demonstrate different threat levels and their blocking policies"""
-        print("\n2. THREAT LEVEL DEMONSTRATION")
-        print("-" * 40)
-        
-        # Simulate different threat scenarios
-        scenarios = [
-            {
-                "name": "Low Threat - Legitimate User",
-                "ip": "10.0.1.100",
-                "metrics": {
-                    "packet_rate": 20,
-                    "byte_rate": 5000,
-                    "connection_rate": 2,
-                    "burst_ratio": 0.2,
-                    "unique_ports": 3,
-                    "repetition_ratio": 0.1
-                },
-                "expected_level": ThreatLevel.LOW
-            },
-            {
-                "name": "Medium Threat - Suspicious Activity",
-                "ip": "10.0.1.101",
-                "metrics": {
-                    "packet_rate": 200,
-                    "byte_rate": 500000,
-                    "connection_rate": 20,
-                    "burst_ratio": 0.6,
-                    "unique_ports": 8,
-                    "repetition_ratio": 0.5
-                },
-                "expected_level": ThreatLevel.MEDIUM
-            },
-            {
-                "name": "High Threat - Attack Pattern",
-                "ip": "10.0.1.102",
-                "metrics": {
-                    "packet_rate": 800,
-                    "byte_rate": 2000000,
-                    "connection_rate": 60,
-                    "burst_ratio": 0.9,
-                    "unique_ports": 15,
-                    "repetition_ratio": 0.8
-                },
-                "expected_level": ThreatLevel.HIGH
-            },
-            {
-                "name": "Critical Threat - DDoS Attack",
-                "ip": "10.0.1.103",
-                "metrics": {
-                    "packet_rate": 1500,
-                    "byte_rate": 8000000,
-                    "connection_rate": 100,
-                    "burst_ratio": 0.95,
-                    "unique_ports": 20,
-                    "repetition_ratio": 0.95
-                },
-                "expected_level": ThreatLevel.CRITICAL
-            }
-        ]
+        self._emit("\n2. THREAT LEVEL DEMONSTRATION")
+        self._emit("-" * 40)
+        
+        # Score every scenario in one batch (single reputation query)
+        metric_fields = self._abs.METRIC_FIELDS
+        traffic = [dict(zip(metric_fields, scenario.metrics)) for scenario in _SCENARIOS]
+        threat_scores = self.adaptive_system.calculate_threat_score_batch(
+            [scenario.ip for scenario in _SCENARIOS], traffic
+        )
+        threat_levels = self.adaptive_system.determine_threat_levels(threat_scores)
         
-        for scenario in scenarios:
-            print(f"\n🔍 Scenario: {scenario['name']}")
-            print(f"   IP: {scenario['ip']}")
-            print(f"   Traffic Metrics: {scenario['metrics']}")
-            
-            # Calculate threat score
-            threat_score = self.adaptive_system.calculate_threat_score(
-                scenario['ip'], scenario['metrics']
-            )
-            threat_level = self.adaptive_system.determine_threat_level(threat_score)
-            
-            print(f"   📊 Threat Score: {threat_score.total_score:.3f}")
-            print(f"   🎯 Threat Level: {threat_level.value}")
-            print(f"   📈 Confidence: {threat_score.confidence:.3f}")
-            
+        for scenario, metrics, threat_score, threat_level in zip(_SCENARIOS, traffic, threat_scores, threat_levels):
             # Check blocking decision
-            should_block, reason = self.adaptive_system.should_block(scenario['ip'], scenario['metrics'])
-            print(f"   🚫 Block Decision: {should_block} ({reason})")
+            should_block, reason = self.adaptive_system.should_block(scenario.ip, metrics)
+            self._emit(_SCENARIO_TMPL.format_map({
+                'name': scenario.name,
+                'ip': scenario.ip,
+                'metrics': metrics,
+                'score': threat_score.total_score,
+                'level': self._abs.THREAT_LEVEL_NAMES[threat_level],
+                'conf': threat_score.confidence,
+                'blk': should_block,
+                'reason': reason
+            }))
             
             if should_block:
-                policy = self.adaptive_system.block_ip(scenario['ip'], scenario['metrics'])
-                print(f"   ⏱️  Initial Duration: {policy.initial_duration}s")
-                print(f"   ⏱️  Max Duration: {policy.max_duration}s")
-                print(f"   📋 Policy State: {policy.blocking_state.value}")
+                policy = self.adaptive_system.block_ip(scenario.ip, metrics)
+                self._emit(_POLICY_TMPL.format_map({
+                    'initial': policy.initial_duration,
+                    'max': policy.max_duration,
+                    'state': self._abs.BLOCKING_STATE_NAMES[policy.blocking_state]
+                }))
     
     def demonstrate_reputation_system(self):
         """Demonstrate reputation-based blocking adjustments"""
-        print("\n3. REPUTATION SYSTEM DEMONSTRATION")
-        print("-" * 40)
+        self._emit("\n3. REPUTATION SYSTEM DEMONSTRATION")
+        self._emit("-" * 40)
         
         test_ip = "10.0.1.200"
         
-        print(f"\n🔍 Testing IP: {test_ip}")
+        self._emit(f"\n🔍 Testing IP: {test_ip}")
+        
+        reputation_system = self.adaptive_system.reputation_system
+        test_ip_u32 = self._abs.ip_to_u32(test_ip)  # Translate once for the lookups below
         
         # Initial reputation (neutral)
-        initial_reputation = self.adaptive_system.reputation_system.get_reputation(test_ip)
-        print(f"   📊 Initial Reputation: {initial_reputation:.3f}")
+        initial_reputation = reputation_system.get_reputation_u32(test_ip_u32)
+        self._emit(f"   📊 Initial Reputation: {initial_reputation:.3f}")
         
         # Simulate legitimate behavior
-        print("\n   🟢 Simulating legitimate behavior...")
+        self._emit("\n   🟢 Simulating legitimate behavior...")
         for i in range(5):
-            self.adaptive_system.reputation_system.update_reputation(test_ip, False, False)
-            reputation = self.adaptive_system.reputation_system.get_reputation(test_ip)
-            print(f"   📈 After {i+1} legitimate connections: {reputation:.3f}")
+            reputation_system.update_reputation(test_ip, False, False)
+            reputation = reputation_system.get_reputation_u32(test_ip_u32)
+            self._emit(f"   📈 After {i+1} legitimate connections: {reputation:.3f}")
         
         # Test blocking decision with good reputation
         traffic_metrics = {
@@ -179,61 +217,51 @@ class AdaptiveBlockingDemo:
         }
         
         should_block, reason = self.adaptive_system.should_block(test_ip, traffic_metrics)
-        print(f"   🚫 Block Decision (good reputation): {should_block} ({reason})")
+        self._emit(f"   🚫 Block Decision (good reputation): {should_block} ({reason})")
         
         # Simulate malicious behavior
-        print("\n   🔴 Simulating malicious behavior...")
+        self._emit("\n   🔴 Simulating malicious behavior...")
         for i in range(3):
-            self.adaptive_system.reputation_system.update_reputation(test_ip, True, False)
-            reputation = self.adaptive_system.reputation_system.get_reputation(test_ip)
-            print(f"   📉 After {i+1} malicious connections: {reputation:.3f}")
+            reputation_system.update_reputation(test_ip, True, False)
+            reputation = reputation_system.get_reputation_u32(test_ip_u32)
+            self._emit(f"   📉 After {i+1} malicious connections: {reputation:.3f}")
         
         # Test blocking decision with poor reputation
         should_block, reason = self.adaptive_system.should_block(test_ip, traffic_metrics)
-        print(f"   🚫 Block Decision (poor reputation): {should_block} ({reason})")
+        self._emit(f"   🚫 Block Decision (poor reputation): {should_block} ({reason})")
         
         # Demonstrate false positive handling
-        print("\n   🟡 Simulating false positive...")
-        self.adaptive_system.reputation_system.update_reputation(test_ip, False, True)
-        reputation = self.adaptive_system.reputation_system.get_reputation(test_ip)
-        print(f"   📊 After false positive correction: {reputation:.3f}")
+        self._emit("\n   🟡 Simulating false positive...")
+        reputation_system.update_reputation(test_ip, False, True)
+        reputation = reputation_system.get_reputation_u32(test_ip_u32)
+        self._emit(f"   📊 After false positive correction: {reputation:.3f}")
     
     def demonstrate_behavioral_analysis(self):
         """Demonstrate behavioral analysis for unblocking decisions"""
-        print("\n4. BEHAVIORAL ANALYSIS DEMONSTRATION")
-        print("-" * 40)
+        self._emit("\n4. BEHAVIORAL ANALYSIS DEMONSTRATION")
+        self._emit("-" * 40)
         
         test_ip = "10.0.1.250"
         
-        print(f"\n🔍 Testing behavioral analysis for: {test_ip}")
+        self._emit(f"\n🔍 Testing behavioral analysis for: {test_ip}")
         
         # Simulate consistent legitimate traffic patterns
-        print("\n   📊 Building traffic pattern history...")
-        for i in range(15):
-            # Simulate consistent, moderate traffic
-            traffic_metrics = {
-                "packet_rate": 25 + random.uniform(-5, 5),
-                "byte_rate": 8000 + random.uniform(-2000, 2000),
-                "connection_rate": 3 + random.uniform(-1, 1),
-                "burst_ratio": 0.3 + random.uniform(-0.1, 0.1),
-                "unique_ports": 2,
-                "repetition_ratio": 0.2 + random.uniform(-0.05, 0.05)
-            }
-            
-            behavior_analysis = self.adaptive_system.behavior_analyzer.analyze_traffic_pattern(
-                test_ip, traffic_metrics
-            )
-            
+        self._emit("\n   📊 Building traffic pattern history...")
+        # Simulate consistent, moderate traffic
+        # Columns: packet_rate, byte_rate, connection_rate, burst_ratio, unique_ports, repetition_ratio
+        history = _jittered_traffic((25, 8000, 3, 0.3, 2, 0.2), (5, 2000, 1, 0.1, 0, 0.05), 15)
+        analyses = self.adaptive_system.behavior_analyzer.analyze_batch(test_ip, history)
+        for i, behavior_analysis in enumerate(analyses):
             if i % 5 == 4:  # Show progress every 5 iterations
-                print(f"   📈 Pattern {i+1}: Score={behavior_analysis['behavior_score']:.3f}, "
-                      f"Confidence={behavior_analysis['confidence']:.3f}")
+                self._emit(f"   📈 Pattern {i+1}: Score={behavior_analysis['behavior_score']:.3f}, "
+                           f"Confidence={behavior_analysis['confidence']:.3f}")
         
         # Test legitimate pattern detection
         is_legitimate = self.adaptive_system.behavior_analyzer.is_legitimate_pattern(test_ip)
-        print(f"   ✅ Legitimate pattern detected: {is_legitimate}")
+        self._emit(f"   ✅ Legitimate pattern detected: {is_legitimate}")
         
         # Test with anomalous traffic
-        print("\n   🚨 Testing anomalous traffic pattern...")
+        self._emit("\n   🚨 Testing anomalous traffic pattern...")
         anomalous_metrics = {
             "packet_rate": 500,  # Sudden spike
             "byte_rate": 1000000,
@@ -247,22 +275,22 @@ class AdaptiveBlockingDemo:
             test_ip, anomalous_metrics
         )
         
-        print(f"   📊 Anomaly Score: {behavior_analysis['behavior_score']:.3f}")
-        print(f"   🎯 Confidence: {behavior_analysis['confidence']:.3f}")
-        print(f"   📈 Deviations: {behavior_analysis.get('deviations', {})}")
+        self._emit(f"   📊 Anomaly Score: {behavior_analysis['behavior_score']:.3f}")
+        self._emit(f"   🎯 Confidence: {behavior_analysis['confidence']:.3f}")
+        self._emit(f"   📈 Deviations: {behavior_analysis.get('deviations', {})}")
     
     def demonstrate_adaptive_thresholds(self):
         """Demonstrate adaptive thresholds based on network conditions"""
-        print("\n5. ADAPTIVE THRESHOLDS DEMONSTRATION")
-        print("-" * 40)
+        self._emit("\n5. ADAPTIVE THRESHOLDS DEMONSTRATION")
+        self._emit("-" * 40)
         
         # Show initial thresholds
-        print("\n📊 Initial Dynamic Thresholds:")
+        self._emit("\n📊 Initial Dynamic Thresholds:")
         for level, threshold in self.adaptive_system.dynamic_thresholds.items():
-            print(f"   {level}: {threshold:.3f}")
+            self._emit(f"   {level}: {threshold:.3f}")
         
         # Simulate high attack frequency
-        print("\n🚨 Simulating high attack frequency...")
+        self._emit("\n🚨 Simulating high attack frequency...")
         network_conditions = {
             'load': 0.4,
             'attack_frequency': 0.8,  # High attack frequency
@@ -272,12 +300,12 @@ class AdaptiveBlockingDemo:
         
         self.adaptive_system.update_network_conditions(network_conditions)
         
-        print("📊 Adjusted Thresholds (stricter during attacks):")
+        self._emit("📊 Adjusted Thresholds (stricter during attacks):")
         for level, threshold in self.adaptive_system.dynamic_thresholds.items():
-            print(f"   {level}: {threshold:.3f}")
+            self._emit(f"   {level}: {threshold:.3f}")
         
         # Simulate high false positive rate
-        print("\n🟡 Simulating high false positive rate...")
+        self._emit("\n🟡 Simulating high false positive rate...")
         network_conditions = {
             'load': 0.3,
             'attack_frequency': 0.2,
@@ -287,14 +315,14 @@ class AdaptiveBlockingDemo:
         
         self.adaptive_system.update_network_conditions(network_conditions)
         
-        print("📊 Adjusted Thresholds (more lenient to reduce false positives):")
+        self._emit("📊 Adjusted Thresholds (more lenient to reduce false positives):")
         for level, threshold in self.adaptive_system.dynamic_thresholds.items():
-            print(f"   {level}: {threshold:.3f}")
+            self._emit(f"   {level}: {threshold:.3f}")
     
     def demonstrate_unblocking_intelligence(self):
         """Demonstrate intelligent unblocking decisions"""
-        print("\n6. INTELLIGENT UNBLOCKING DEMONSTRATION")
-        print("-" * 40)
+        self._emit("\n6. INTELLIGENT UNBLOCKING DEMONSTRATION")
+        self._emit("-" * 40)
         
         # Create a test blocking scenario
         test_ip = "10.0.1.300"
@@ -309,77 +337,70 @@ class AdaptiveBlockingDemo:
             "repetition_ratio": 0.5
         }
         
-        print(f"\n🔍 Testing intelligent unblocking for: {test_ip}")
+        self._emit(f"\n🔍 Testing intelligent unblocking for: {test_ip}")
         
         # Block the IP
         should_block, reason = self.adaptive_system.should_block(test_ip, traffic_metrics)
         if should_block:
             policy = self.adaptive_system.block_ip(test_ip, traffic_metrics)
-            print(f"   🚫 IP blocked: {reason}")
-            print(f"   ⏱️  Initial duration: {policy.initial_duration}s")
-            print(f"   📋 Threat level: {policy.threat_level.value}")
+            self._emit(f"   🚫 IP blocked: {reason}")
+            self._emit(f"   ⏱️  Initial duration: {policy.initial_duration}s")
+            self._emit(f"   📋 Threat level: {self._abs.THREAT_LEVEL_NAMES[policy.threat_level]}")
         
         # Simulate good reputation building
-        print("\n   📈 Building positive reputation...")
+        self._emit("\n   📈 Building positive reputation...")
         for i in range(3):
             self.adaptive_system.reputation_system.update_reputation(test_ip, False, False)
         
         # Add legitimate traffic patterns
-        print("   📊 Establishing legitimate traffic patterns...")
-        for i in range(10):
-            legitimate_metrics = {
-                "packet_rate": 20 + random.uniform(-3, 3),
-                "byte_rate": 6000 + random.uniform(-1000, 1000),
-                "connection_rate": 2 + random.uniform(-0.5, 0.5),
-                "burst_ratio": 0.2 + random.uniform(-0.05, 0.05),
-                "unique_ports": 2,
-                "repetition_ratio": 0.15 + random.uniform(-0.03, 0.03)
-            }
-            self.adaptive_system.behavior_analyzer.analyze_traffic_pattern(test_ip, legitimate_metrics)
+        self._emit("   📊 Establishing legitimate traffic patterns...")
+        legitimate_history = _jittered_traffic((20, 6000, 2, 0.2, 2, 0.15), (3, 1000, 0.5, 0.05, 0, 0.03), 10, offset=15)
+        for legitimate_row in legitimate_history:
+            self.adaptive_system.behavior_analyzer.analyze_traffic_row(test_ip, legitimate_row)
         
         # Check unblocking decision
         should_unblock, unblock_reason = self.adaptive_system.should_unblock(test_ip)
-        print(f"   ✅ Should unblock: {should_unblock} ({unblock_reason})")
+        self._emit(f"   ✅ Should unblock: {should_unblock} ({unblock_reason})")
         
         # Get current policy status
         status = self.adaptive_system.get_policy_status(test_ip)
         if status:
-            print(f"   📊 Policy Status:")
-            print(f"      - State: {status['blocking_state']}")
-            print(f"      - Elapsed: {status['elapsed_time']:.0f}s")
-            print(f"      - Remaining: {status['remaining_time']:.0f}s")
-            print(f"      - Reputation: {status['reputation']:.3f}")
-            print(f"      - False Positive Score: {status['false_positive_score']:.3f}")
+            self._emit(f"   📊 Policy Status:")
+            self._emit(f"      - State: {status['blocking_state']}")
+            self._emit(f"      - Elapsed: {status['elapsed_time']:.0f}s")
+            self._emit(f"      - Remaining: {status['remaining_time']:.0f}s")
+            self._emit(f"      - Reputation: {status['reputation']:.3f}")
+            self._emit(f"      - False Positive Score: {status['false_positive_score']:.3f}")
     
     def demonstrate_system_integration(self):
         """Demonstrate system integration and statistics"""
-        print("\n7. SYSTEM INTEGRATION & STATISTICS")
-        print("-" * 40)
+        self._emit("\n7. SYSTEM INTEGRATION & STATISTICS")
+        self._emit("-" * 40)
         
         # Get system statistics
         stats = self.adaptive_system.get_system_stats()
         
-        print("\n📊 System Statistics:")
-        print(f"   🚫 Active Blocks: {stats['active_blocks']}")
-        print(f"   👁️  Monitoring: {stats['monitoring_blocks']}")
-        print(f"   📋 Total Policies: {stats['total_policies']}")
+        self._emit("\n📊 System Statistics:")
+        self._emit(f"   🚫 Active Blocks: {stats['active_blocks']}")
+        self._emit(f"   👁️  Monitoring: {stats['monitoring_blocks']}")
+        self._emit(f"   📋 Total Policies: {stats['total_policies']}")
         
-        print("\n📈 Threat Level Distribution:")
+        self._emit("\n📈 Threat Level Distribution:")
         for level, count in stats['threat_level_distribution'].items():
-            print(f"   {level}: {count}")
+            self._emit(f"   {level}: {count}")
         
-        print("\n🌐 Network Conditions:")
+        self._emit("\n🌐 Network Conditions:")
         for condition, value in stats['network_conditions'].items():
-            print(f"   {condition}: {value:.3f}")
+            self._emit(f"   {condition}: {value:.3f}")
         
-        print("\n🎯 Dynamic Thresholds:")
+        self._emit("\n🎯 Dynamic Thresholds:")
         for threshold, value in stats['dynamic_thresholds'].items():
-            print(f"   {threshold}: {value:.3f}")
+            self._emit(f"   {threshold}: {value:.3f}")
     
     def demonstrate_comparison(self):
         """Demonstrate comparison with inflexible system"""
-        print("\n8. COMPARISON WITH INFLEXIBLE SYSTEM")
-        print("-" * 40)
+        self._emit("\n8. COMPARISON WITH INFLEXIBLE SYSTEM")
+        self._emit("-" * 40)
         
         comparison_data = [
             {
@@ -415,60 +436,92 @@ class AdaptiveBlockingDemo:
         ]
         
         for item in comparison_data:
-            print(f"\n📊 {item['aspect']}:")
-            print(f"   ❌ Inflexible: {item['inflexible']}")
-            print(f"   ✅ Adaptive: {item['adaptive']}")
+            self._emit(f"\n📊 {item['aspect']}:")
+            self._emit(f"   ❌ Inflexible: {item['inflexible']}")
+            self._emit(f"   ✅ Adaptive: {item['adaptive']}")
     
-    def run_complete_demonstration(self):
+    def run_complete_demonstration(self, parallel=False):
         """Run complete demonstration"""
         try:
-            self.demonstrate_problem_and_solution()
-            self.demonstrate_threat_levels()
-            self.demonstrate_reputation_system()
-            self.demonstrate_behavioral_analysis()
-            self.demonstrate_adaptive_thresholds()
-            self.demonstrate_unblocking_intelligence()
-            self.demonstrate_system_integration()
-            self.demonstrate_comparison()
+            sections = (
+                self.demonstrate_problem_and_solution,
+                self.demonstrate_threat_levels,
+                self.demonstrate_reputation_system,
+                self.demonstrate_behavioral_analysis,
+                self.demonstrate_adaptive_thresholds,
+                self.demonstrate_unblocking_intelligence,
+                self.demonstrate_system_integration,
+                self.demonstrate_comparison
+            )
+            captured = {}
+            if parallel:
+                # Sections 1-4 and 8 do not depend on each other: run them
+                # concurrently. 5-7 adjust thresholds or report on earlier
+                # sections, so they run afterwards in order.
+                independent = sections[:4] + sections[7:]
+                with ThreadPoolExecutor(max_workers=len(independent)) as executor:
+                    captured = {
+                        demonstrate: executor.submit(self._capture, demonstrate)
+                        for demonstrate in independent
+                    }
             
-            print("\n" + "=" * 70)
-            print("🎉 DEMONSTRATION COMPLETE")
-            print("=" * 70)
+            for demonstrate in sections:
+                if demonstrate in captured:
+                    sys.stdout.write(captured[demonstrate].result())
+                    sys.stdout.flush()
+                else:
+                    demonstrate()
+                    self._flush()
             
-            print("\n✅ KEY ACHIEVEMENTS:")
-            print("   🔄 Dynamic blocking duration based on threat assessment")
-            print("   📊 Reputation-based policy adjustment")
-            print("   🧠 Behavioral analysis for legitimate user detection")
-            print("   🎯 Adaptive thresholds responding to network conditions")
-            print("   🚨 False positive detection and mitigation")
-            print("   ⚡ Real-time policy adjustment")
-            print("   🔧 Seamless integration with existing system")
+            self._emit("\n" + "=" * 70)
+            self._emit("🎉 DEMONSTRATION COMPLETE")
+            self._emit("=" * 70)
             
-            print("\n🎯 INFLEXIBLE BLOCKING/UNBLOCKING POLICY FLAW RESOLVED!")
-            print("The system now provides intelligent, context-aware blocking decisions")
-            print("that adapt to network conditions and user behavior patterns.")
+            self._emit("\n✅ KEY ACHIEVEMENTS:")
+            self._emit("   🔄 Dynamic blocking duration based on threat assessment")
+            self._emit("   📊 Reputation-based policy adjustment")
+            self._emit("   🧠 Behavioral analysis for legitimate user detection")
+            self._emit("   🎯 Adaptive thresholds responding to network conditions")
+            self._emit("   🚨 False positive detection and mitigation")
+            self._emit("   ⚡ Real-time policy adjustment")
+            self._emit("   🔧 Seamless integration with existing system")
+            
+            self._emit("\n🎯 INFLEXIBLE BLOCKING/UNBLOCKING POLICY FLAW RESOLVED!")
+            self._emit("The system now provides intelligent, context-aware blocking decisions")
+            self._emit("that adapt to network conditions and user behavior patterns.")
             
         except Exception as e:
+            self._flush()
             print(f"❌ Error during demonstration: {e}")
-            import traceback
             traceback.print_exc()
         
         finally:
-            # Cleanup
-            self.policy_store.close()
+            self._flush()
     
     def cleanup(self):
-        """Clean up resources"""
-        if hasattr(self, 'policy_store'):
+        """Clean up resources (safe to call more than once)"""
+        if hasattr(self, 'policy_store') and not self._store_closed:
+            self._store_closed = True
             self.policy_store.close()
 
 
 def main():
     """Main demonstration function"""
-    demo = AdaptiveBlockingDemo()
+    print("=" * 70)
+    print("🔄 ADAPTIVE BLOCKING/UNBLOCKING POLICY DEMONSTRATION")
+    print("Addressing the Inflexible Blocking/Unblocking Policy Flaw")
+    print("=" * 70)
+    
+    try:
+        demo = AdaptiveBlockingDemo()
+    except ImportError as e:
+        print(f"❌ Import error: {e}")
+        sys.exit(1)
+    print("✅ Adaptive blocking system imported successfully")
     
     try:
-        demo.run_complete_demonstration()
+        # --parallel runs the independent sections concurrently
+        demo.run_complete_demonstration(parallel="--parallel" in sys.argv[1:])
     except KeyboardInterrupt:
         print("\n🛑 Demonstration interrupted by user")
     except Exception as e:
@@ -19,20 +19,28 @@ print("=" * 70)
 print("🚀 PRACTICAL DEMO: INTEGRATED ADAPTIVE BLOCKING SYSTEM")
 print("=" * 70)
 
+def _write_lines(lines):
+    """Write buffered output lines to stdout with a single write"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
 def demo_integrated_adaptive_blocking():
     """Demonstrate the integrated adaptive blocking system"""
+    lines = []
+    emit = lines.append
     
-    print("\n1. 🔧 SYSTEM INITIALIZATION")
-    print("-" * 50)
+    emit("\n1. 🔧 SYSTEM INITIALIZATION")
+    emit("-" * 50)
     
     # Note: In a real scenario, this would be initialized by the Ryu controller
-    print("📝 In a real deployment:")
-    print("   - The modular controller initializes automatically with Ryu")
-    print("   - Adaptive blocking integration happens during controller startup")
-    print("   - All components are connected and monitoring network traffic")
+    emit("📝 In a real deployment:")
+    emit("   - The modular controller initializes automatically with Ryu")
+    emit("   - Adaptive blocking integration happens during controller startup")
+    emit("   - All components are connected and monitoring network traffic")
     
-    print("\n2. 📊 MONITORING AND DETECTION")
-    print("-" * 50)
+    emit("\n2. 📊 MONITORING AND DETECTION")
+    emit("-" * 50)
     
     # Simulate network scenarios
     scenarios = [
@@ -91,28 +99,28 @@ def demo_integrated_adaptive_blocking():
     ]
     
     for i, scenario in enumerate(scenarios, 1):
-        print(f"\n   📋 Scenario {i}: {scenario['name']}")
-        print(f"   🖥️  IP: {scenario['ip']}")
-        print(f"   📈 Metrics: {scenario['metrics']}")
-        print(f"   🎯 Expected: {scenario['expected']}")
+        emit(f"\n   📋 Scenario {i}: {scenario['name']}")
+        emit(f"   🖥️  IP: {scenario['ip']}")
+        emit(f"   📈 Metrics: {scenario['metrics']}")
+        emit(f"   🎯 Expected: {scenario['expected']}")
     
-    print("\n3. 🔄 ADAPTIVE DECISION PROCESS")
-    print("-" * 50)
+    emit("\n3. 🔄 ADAPTIVE DECISION PROCESS")
+    emit("-" * 50)
     
-    print("📝 How the integrated system works:")
-    print("   1. 📡 Network Monitor collects traffic statistics from switches")
-    print("   2. 🔍 Threat Detector analyzes patterns for anomalies")
-    print("   3. 🧠 Adaptive Blocking System calculates threat scores:")
-    print("      - Base score (traffic metrics)")
-    print("      - Reputation score (historical behavior)")
-    print("      - Behavior score (pattern analysis)")
-    print("      - Pattern score (ML-based detection)")
-    print("   4. 🎯 Dynamic thresholds determine threat level")
-    print("   5. 📋 Mitigation Policy creates adaptive blocking rules")
-    print("   6. ⚡ Enhanced Enforcer implements blocking actions")
+    emit("📝 How the integrated system works:")
+    emit("   1. 📡 Network Monitor collects traffic statistics from switches")
+    emit("   2. 🔍 Threat Detector analyzes patterns for anomalies")
+    emit("   3. 🧠 Adaptive Blocking System calculates threat scores:")
+    emit("      - Base score (traffic metrics)")
+    emit("      - Reputation score (historical behavior)")
+    emit("      - Behavior score (pattern analysis)")
+    emit("      - Pattern score (ML-based detection)")
+    emit("   4. 🎯 Dynamic thresholds determine threat level")
+    emit("   5. 📋 Mitigation Policy creates adaptive blocking rules")
+    emit("   6. ⚡ Enhanced Enforcer implements blocking actions")
     
-    print("\n4. 🎛️  ADAPTIVE FEATURES IN ACTION")
-    print("-" * 50)
+    emit("\n4. 🎛️  ADAPTIVE FEATURES IN ACTION")
+    emit("-" * 50)
     
     features = [
         {
@@ -148,16 +156,16 @@ def demo_integrated_adaptive_blocking():
     ]
     
     for feature in features:
-        print(f"   ✅ {feature['feature']}")
-        print(f"      📄 {feature['description']}")
-        print(f"      🎯 {feature['benefit']}")
-        print()
+        emit(f"   ✅ {feature['feature']}")
+        emit(f"      📄 {feature['description']}")
+        emit(f"      🎯 {feature['benefit']}")
+        emit("")
     
-    print("5. 📈 ADMIN MONITORING & CONTROL")
-    print("-" * 50)
+    emit("5. 📈 ADMIN MONITORING & CONTROL")
+    emit("-" * 50)
     
-    print("📝 Available admin commands in integrated system:")
-    print()
+    emit("📝 Available admin commands in integrated system:")
+    emit("")
     
     admin_commands = [
         {
@@ -193,36 +201,36 @@ def demo_integrated_adaptive_blocking():
     ]
     
     for cmd in admin_commands:
-        print(f"   🔧 {cmd['command']}")
-        print(f"      📄 {cmd['description']}")
-        print(f"      📤 Returns: {cmd['returns']}")
-        print()
+        emit(f"   🔧 {cmd['command']}")
+        emit(f"      📄 {cmd['description']}")
+        emit(f"      📤 Returns: {cmd['returns']}")
+        emit("")
     
-    print("6. 🚀 DEPLOYMENT INSTRUCTIONS")
-    print("-" * 50)
+    emit("6. 🚀 DEPLOYMENT INSTRUCTIONS")
+    emit("-" * 50)
     
-    print("📝 To deploy the integrated adaptive blocking system:")
-    print()
-    print("   1. 📦 Ensure all dependencies are installed:")
-    print("      pip install -r requirements.txt")
-    print()
-    print("   2. 🔧 Start the Ryu controller:")
-    print("      ryu-manager modular_controller.py")
-    print()
-    print("   3. 🌐 Set up your Mininet topology:")
-    print("      sudo python topology.py")
-    print()
-    print("   4. 📊 Monitor through logs or admin interface:")
-    print("      - Watch console output for blocking decisions")
-    print("      - Use admin commands for detailed monitoring")
-    print("      - Check SQLite databases for historical data")
-    print()
-    print("   5. 🧪 Test with attack simulation:")
-    print("      python demo_enhanced_mitigation.py")
-    print()
+    emit("📝 To deploy the integrated adaptive blocking system:")
+    emit("")
+    emit("   1. 📦 Ensure all dependencies are installed:")
+    emit("      pip install -r requirements.txt")
+    emit("")
+    emit("   2. 🔧 Start the Ryu controller:")
+    emit("      ryu-manager modular_controller.py")
+    emit("")
+    emit("   3. 🌐 Set up your Mininet topology:")
+    emit("      sudo python topology.py")
+    emit("")
+    emit("   4. 📊 Monitor through logs or admin interface:")
+    emit("      - Watch console output for blocking decisions")
+    emit("      - Use admin commands for detailed monitoring")
+    emit("      - Check SQLite databases for historical data")
+    emit("")
+    emit("   5. 🧪 Test with attack simulation:")
+    emit("      python demo_enhanced_mitigation.py")
+    emit("")
     
-    print("7. 🎯 INTEGRATION BENEFITS")
-    print("-" * 50)
+    emit("7. 🎯 INTEGRATION BENEFITS")
+    emit("-" * 50)
     
     benefits = [
         "🔄 Seamless integration with existing controller architecture",
@@ -238,23 +246,26 @@ def demo_integrated_adaptive_blocking():
     ]
     
     for benefit in benefits:
-        print(f"   {benefit}")
+        emit(f"   {benefit}")
     
-    print("\n" + "=" * 70)
-    print("🎉 INTEGRATION COMPLETE!")
-    print("=" * 70)
-    print("The Adaptive Blocking System is now fully integrated with the")
-    print("Modular SDN Controller and ready for production use!")
-    print("=" * 70)
+    emit("\n" + "=" * 70)
+    emit("🎉 INTEGRATION COMPLETE!")
+    emit("=" * 70)
+    emit("The Adaptive Blocking System is now fully integrated with the")
+    emit("Modular SDN Controller and ready for production use!")
+    emit("=" * 70)
+    _write_lines(lines)
 
-def show_sample_output():
+def show_sample_output(animate=False):
     """Show sample output from the integrated system"""
+    lines = []
+    emit = lines.append
     
-    print("\n8. 📺 SAMPLE SYSTEM OUTPUT")
-    print("-" * 50)
+    emit("\n8. 📺 SAMPLE SYSTEM OUTPUT")
+    emit("-" * 50)
     
-    print("📝 Sample log output from integrated system:")
-    print()
+    emit("📝 Sample log output from integrated system:")
+    emit("")
     
     sample_logs = [
         "2025-07-08 10:15:23 - ModularSDNController - INFO - 🔄 Adaptive Blocking System integrated successfully",
@@ -269,12 +280,18 @@ def show_sample_output():
         "2025-07-08 10:52:41 - ModularSDNController - INFO - 📊 Updated network conditions: {'load': 0.7, 'attack_frequency': 0.4}"
     ]
     
-    for log in sample_logs:
-        print(f"   {log}")
-        time.sleep(0.1)  # Simulate real-time output
+    if animate:
+        # Pace the log lines: flush what is buffered and print them one by one
+        _write_lines(lines)
+        lines.clear()
+        for log in sample_logs:
+            print(f"   {log}")
+            time.sleep(0.1)  # Simulate real-time output
+    else:
+        lines.extend(f"   {log}" for log in sample_logs)
     
-    print("\n📊 Sample statistics output:")
-    print("""
+    emit("\n📊 Sample statistics output:")
+    emit("""
    {
      "active_blocks": 2,
      "monitoring_blocks": 1,
@@ -297,11 +314,13 @@ def show_sample_output():
      }
    }
    """)
+    _write_lines(lines)
 
 def main():
     """Main demonstration function"""
     demo_integrated_adaptive_blocking()
-    show_sample_output()
+    # --animate paces the sample log lines like real-time output
+    show_sample_output(animate="--animate" in sys.argv[1:])
 
 if __name__ == "__main__":
     main()
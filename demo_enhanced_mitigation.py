@@ -13,12 +13,9 @@ Usage:
     python demo_enhanced_mitigation.py
 """
 
-import time
-import json
-import requests
-from datetime import datetime, timedelta
-from enhanced_mitigation_enforcer import FlowSignature, FlowAnalyzer, EnhancedMitigationEnforcer
-from external_policy_system import SharedPolicyStore
+import sys
+import logging
+from enhanced_mitigation_enforcer import FlowSignature, FlowStats, FlowAnalyzer
 
 # ANSI color codes for output
 RED = "\033[91m"
@@ -28,17 +25,17 @@ BLUE = "\033[94m"
 CYAN = "\033[96m"
 RESET = "\033[0m"
 
+# Header rules are fixed, so color them once
+_SECTION_RULE = f"{BLUE}{'='*60}{RESET}"
+_SUBSECTION_RULE = f"{CYAN}{'-'*40}{RESET}"
+
 def print_section(title):
     """Print a section header"""
-    print(f"\n{BLUE}{'='*60}{RESET}")
-    print(f"{BLUE}{title:^60}{RESET}")
-    print(f"{BLUE}{'='*60}{RESET}")
+    print(f"\n{_SECTION_RULE}\n{BLUE}{title:^60}{RESET}\n{_SECTION_RULE}")
 
 def print_subsection(title):
     """Print a subsection header"""
-    print(f"\n{CYAN}{'-'*40}{RESET}")
-    print(f"{CYAN}{title}{RESET}")
-    print(f"{CYAN}{'-'*40}{RESET}")
+    print(f"\n{_SUBSECTION_RULE}\n{CYAN}{title}{RESET}\n{_SUBSECTION_RULE}")
 
 def demonstrate_over_blocking_problem():
     """Demonstrate the original over-blocking problem"""
@@ -75,7 +72,6 @@ def demonstrate_enhanced_solution():
     print(f"\n{YELLOW}Initializing Enhanced Mitigation System...{RESET}")
     
     # Create a mock flow analyzer for demonstration
-    import logging
     logger = logging.getLogger('demo')
     flow_analyzer = FlowAnalyzer(logger)
     
@@ -118,18 +114,18 @@ def demonstrate_flow_analysis(flow_analyzer):
     print(f"\n{YELLOW}Traffic Pattern Analysis:{RESET}")
     
     # Legitimate traffic (normal rate)
-    flow_analyzer.flow_stats[legitimate_flow] = type('FlowStats', (), {
-        'rate_pps': 10,  # Normal rate
-        'packet_count': 100,
-        'byte_count': 15000
-    })()
+    flow_analyzer.flow_stats[legitimate_flow] = FlowStats(
+        rate_pps=10,  # Normal rate
+        packet_count=100,
+        byte_count=15000
+    )
     
     # Malicious traffic (high rate)
-    flow_analyzer.flow_stats[malicious_flow] = type('FlowStats', (), {
-        'rate_pps': 2000,  # High rate - DoS attack
-        'packet_count': 10000,
-        'byte_count': 1500000
-    })()
+    flow_analyzer.flow_stats[malicious_flow] = FlowStats(
+        rate_pps=2000,  # High rate - DoS attack
+        packet_count=10000,
+        byte_count=1500000
+    )
     
     print(f"   • Legitimate flow: 10 pps, 15KB total")
     print(f"   • Malicious flow: 2000 pps, 1.5MB total")
@@ -388,6 +384,9 @@ def show_configuration_examples():
 
 def main():
     """Main demonstration function"""
+    # --verbose also shows the mitigation components' own log messages
+    logging.basicConfig(level=logging.INFO if "--verbose" in sys.argv[1:] else logging.WARNING)
+    
     print(f"{CYAN}Enhanced Flow-Level Mitigation Demonstration{RESET}")
     print(f"{CYAN}Addressing the Over-blocking Flaw{RESET}")
     
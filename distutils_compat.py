@@ -1,11 +1,46 @@
 # Compatibility layer for distutils.version on Python 3.13+
+import functools
+import re
+import sys
+
 from packaging import version
 
+
+@functools.lru_cache(maxsize=256)
+def _parse(vstring):
+    """Parse a version string, caching repeated inputs"""
+    return version.parse(vstring)
+
+
+_NUMERIC_VERSION = re.compile(r'\d+(?:\.\d+)*', re.ASCII)
+
+
+@functools.lru_cache(maxsize=256)
+def _numeric_key(vstring):
+    """Release tuple of a plain "X.Y.Z" string, or None if it needs the full parser"""
+    if not _NUMERIC_VERSION.fullmatch(vstring):
+        return None
+    release = [int(part) for part in vstring.split('.')]
+    # packaging ignores trailing zeros ("1.0" == "1.0.0")
+    while release and release[-1] == 0:
+        release.pop()
+    return tuple(release)
+
 class LooseVersion:
     """Compatibility wrapper for distutils.version.LooseVersion"""
+    __slots__ = ('vstring', '_version')
+    
     def __init__(self, vstring):
-        self.version = version.parse(str(vstring))
-        self.vstring = vstring
+        # Interned, so equal version strings are the same object
+        self.vstring = sys.intern(str(vstring))
+        self._version = None
+    
+    @property
+    def version(self):
+        """Parsed version, computed on first use"""
+        if self._version is None:
+            self._version = _parse(self.vstring)
+        return self._version
     
     def __str__(self):
         return self.vstring
@@ -13,33 +48,62 @@ class LooseVersion:
     def __repr__(self):
         return f"LooseVersion ('{self.vstring}')"
     
-    def __eq__(self, other):
+    def _operands(self, other):
+        """Comparable keys: release tuples if both are plain numeric, else packaging Versions"""
+        other_vstring = other.vstring if isinstance(other, LooseVersion) else str(other)
+        key, other_key = _numeric_key(self.vstring), _numeric_key(other_vstring)
+        if key is not None and other_key is not None:
+            return key, other_key
         if isinstance(other, LooseVersion):
-            return self.version == other.version
-        return self.version == version.parse(str(other))
+            return self.version, other.version
+        return self.version, _parse(other_vstring)
+    
+    def __eq__(self, other):
+        if isinstance(other, LooseVersion) and self.vstring is other.vstring:
+            return True
+        key, other_key = self._operands(other)
+        return key == other_key
     
     def __lt__(self, other):
-        if isinstance(other, LooseVersion):
-            return self.version < other.version
-        return self.version < version.parse(str(other))
+        key, other_key = self._operands(other)
+        return key < other_key
     
     def __le__(self, other):
-        return self == other or self < other
+        key, other_key = self._operands(other)
+        return key <= other_key
     
     def __gt__(self, other):
-        return not self <= other
+        key, other_key = self._operands(other)
+        return key > other_key
     
     def __ge__(self, other):
-        return not self < other
+        key, other_key = self._operands(other)
+        return key >= other_key
     
     def __ne__(self, other):
-        return not self == other
+        if isinstance(other, LooseVersion) and self.vstring is other.vstring:
+            return False
+        key, other_key = self._operands(other)
+        return key != other_key
+    
+    def __hash__(self):
+        return hash(self.version)
 
 class StrictVersion:
     """Compatibility wrapper for distutils.version.StrictVersion"""
+    __slots__ = ('vstring', '_version')
+    
     def __init__(self, vstring):
-        self.version = version.parse(str(vstring))
-        self.vstring = vstring
+        # Interned, so equal version strings are the same object
+        self.vstring = sys.intern(str(vstring))
+        self._version = None
+    
+    @property
+    def version(self):
+        """Parsed version, computed on first use"""
+        if self._version is None:
+            self._version = _parse(self.vstring)
+        return self._version
     
     def __str__(self):
         return self.vstring
@@ -47,33 +111,52 @@ class StrictVersion:
     def __repr__(self):
         return f"StrictVersion ('{self.vstring}')"
     
-    def __eq__(self, other):
+    def _operands(self, other):
+        """Comparable keys: release tuples if both are plain numeric, else packaging Versions"""
+        other_vstring = other.vstring if isinstance(other, StrictVersion) else str(other)
+        key, other_key = _numeric_key(self.vstring), _numeric_key(other_vstring)
+        if key is not None and other_key is not None:
+            return key, other_key
         if isinstance(other, StrictVersion):
-            return self.version == other.version
-        return self.version == version.parse(str(other))
+            return self.version, other.version
+        return self.version, _parse(other_vstring)
+    
+    def __eq__(self, other):
+        if isinstance(other, StrictVersion) and self.vstring is other.vstring:
+            return True
+        key, other_key = self._operands(other)
+        return key == other_key
     
     def __lt__(self, other):
-        if isinstance(other, StrictVersion):
-            return self.version < other.version
-        return self.version < version.parse(str(other))
+        key, other_key = self._operands(other)
+        return key < other_key
     
     def __le__(self, other):
-        return self == other or self < other
+        key, other_key = self._operands(other)
+        return key <= other_key
     
     def __gt__(self, other):
-        return not self <= other
+        key, other_key = self._operands(other)
+        return key > other_key
     
     def __ge__(self, other):
-        return not self < other
+        key, other_key = self._operands(other)
+        return key >= other_key
     
     def __ne__(self, other):
-        return not self == other
+        if isinstance(other, StrictVersion) and self.vstring is other.vstring:
+            return False
+        key, other_key = self._operands(other)
+        return key != other_key
+    
+    def __hash__(self):
+        return hash(self.version)
 
-# Monkey patch distutils if it doesn't exist
-import sys
-try:
-    import distutils.version
-except ImportError:
+# Monkey patch distutils if it doesn't exist. find_spec only locates the
+# package, so a real distutils is left for its users to import, and nothing
+# is done when distutils.version (real or shim) is already loaded.
+import importlib.util
+if 'distutils.version' not in sys.modules and importlib.util.find_spec('distutils') is None:
     # Create a fake distutils module
     import types
     distutils = types.ModuleType('distutils')
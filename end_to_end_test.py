@@ -18,18 +18,63 @@ Run th            self.policy_store.add_policy(policy_2)
             print_success("Cross-instance policy synchronization")ipt to verify the entire system works correctly.
 """
 
+import io
 import sys
 import os
 import time
 import tempfile
 import logging
 import threading
-import requests
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, MagicMock
 
 # Add project directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Project modules, imported once for all tests (distutils shim first).
+# A failed import is kept and re-raised by the tests that need the module,
+# so test_imports still reports it and the other tests still run
+try:
+    import distutils_compat
+except Exception:
+    pass  # test_imports reports it; the modules below import it themselves
+
+try:
+    from external_policy_system import SharedPolicyStore, PolicyRule, PolicySource, PolicyAction
+    POLICY_SYSTEM_ERROR = None
+except Exception as e:
+    POLICY_SYSTEM_ERROR = e
+
+try:
+    from adaptive_blocking_system import AdaptiveBlockingSystem
+    ADAPTIVE_BLOCKING_ERROR = None
+except Exception as e:
+    ADAPTIVE_BLOCKING_ERROR = e
+
+try:
+    from enhanced_mitigation_enforcer import EnhancedMitigationEnforcer
+    ENHANCED_MITIGATION_ERROR = None
+except Exception as e:
+    ENHANCED_MITIGATION_ERROR = e
+
+# The modular controller needs Ryu; its test reports the error if missing
+try:
+    from modular_controller import (
+        NetworkMonitor, ThreatDetector, MitigationPolicy,
+        TrafficMetrics, ThreatEvent
+    )
+    MODULAR_CONTROLLER_ERROR = None
+except ImportError as e:
+    MODULAR_CONTROLLER_ERROR = e
+
+# Component loggers handed to the code under test
+_TEST_CTRL_LOG = logging.getLogger("test_controller")
+_TEST_ENF_LOG = logging.getLogger("test_enforcer")
+
+# Scratch databases go to tmpfs when available (default temp dir otherwise)
+SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
 # ANSI Colors
 RED = "\033[91m"
 GREEN = "\033[92m"
@@ -39,36 +84,117 @@ PURPLE = "\033[95m"
 CYAN = "\033[96m"
 RESET = "\033[0m"
 
+# Tests running on a worker thread buffer their output and results here
+_captured = threading.local()
+
+_HEADER_RULE = f"{BLUE}{'='*60}{RESET}"
+
+def _write(text):
+    """Write a line, or buffer it when the calling thread is captured"""
+    out = getattr(_captured, 'out', None)
+    (sys.stdout if out is None else out).write(text + "\n")
+
 def print_header(text):
-    print(f"\n{BLUE}{'='*60}{RESET}")
-    print(f"{BLUE}{text:^60}{RESET}")
-    print(f"{BLUE}{'='*60}{RESET}")
+    _write(f"\n{_HEADER_RULE}\n{BLUE}{text:^60}{RESET}\n{_HEADER_RULE}")
 
 def print_test(text):
-    print(f"{CYAN}🧪 {text}...{RESET}")
+    _write(f"{CYAN}🧪 {text}...{RESET}")
 
 def print_success(text):
-    print(f"{GREEN}✅ {text}{RESET}")
+    _write(f"{GREEN}✅ {text}{RESET}")
 
 def print_warning(text):
-    print(f"{YELLOW}⚠️  {text}{RESET}")
+    _write(f"{YELLOW}⚠️  {text}{RESET}")
 
 def print_error(text):
-    print(f"{RED}❌ {text}{RESET}")
+    _write(f"{RED}❌ {text}{RESET}")
 
 class EndToEndTest:
+    # (result name, test method, tests that must pass first); dependencies
+    # come earlier in the table and a failed dependency skips the test
+    TESTS = (
+        ("Imports", "test_imports", ()),
+        ("Policy System", "test_policy_system", ()),
+        ("Adaptive Blocking", "test_adaptive_blocking", ("Policy System",)),
+        ("Controller Integration", "test_controller_integration", ()),
+        ("Enhanced Mitigation", "test_enhanced_mitigation", ()),
+        ("Database Persistence", "test_database_persistence", ("Policy System",)),
+        ("Conflict Resolution", "test_conflict_resolution", ("Policy System",)),
+    )
+    
     def __init__(self):
         self.temp_db = None
         self.policy_store = None
         self.controller = None
         self.results = []
+        self._passed = {}
+        
+    def _record(self, result):
+        """Record a (test name, verdict) pair"""
+        getattr(_captured, 'results', self.results).append(result)
+    
+    def _run_test(self, name, method, requires):
+        """Run one table entry, skipping it if a required test did not pass"""
+        missing = [dep for dep in requires if not self._passed.get(dep)]
+        if missing:
+            print_warning(f"Skipping {name}: requires {', '.join(missing)}")
+            self._record((name, "SKIP"))
+            passed = False
+        else:
+            passed = bool(getattr(self, method)())
+        self._passed[name] = passed
+        return passed
+    
+    def _capture(self, *entries):
+        """Run table entries in order, returning each one's buffered output and results"""
+        captured = []
+        try:
+            for entry in entries:
+                _captured.out, _captured.results = io.StringIO(), []
+                self._run_test(*entry)
+                captured.append((entry[0], _captured.out.getvalue(), _captured.results))
+            return captured
+        finally:
+            del _captured.out, _captured.results
+    
+    def _run_parallel(self):
+        """Run independent tests concurrently, reporting in table order"""
+        # Tests with the same requirements share the state those set up (the
+        # policy store), so each such group runs in table order on one worker
+        groups = {}
+        for entry in self.TESTS:
+            groups.setdefault(entry[2], []).append(entry)
         
+        futures = {}
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for entry in groups.pop((), []):
+                futures[entry[0]] = executor.submit(self._capture, entry)
+            for requires, entries in groups.items():
+                for dep in requires:
+                    futures[dep].result()
+                future = executor.submit(self._capture, *entries)
+                for entry in entries:
+                    futures[entry[0]] = future
+            
+            captured = {}
+            for future in futures.values():
+                for name, output, results in future.result():
+                    captured[name] = (output, results)
+        
+        for name, _, _ in self.TESTS:
+            output, results = captured[name]
+            sys.stdout.write(output)
+            self.results.extend(results)
+        sys.stdout.flush()
+    
     def setup_logging(self):
         """Setup logging for the test"""
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
+        # The format has no thread fields, so skip recording them
+        logging.logThreads = False
         self.logger = logging.getLogger("E2E_Test")
         
     def test_imports(self):
@@ -110,12 +236,12 @@ class EndToEndTest:
             from enhanced_mitigation_enforcer import EnhancedMitigationEnforcer
             print_success("Enhanced mitigation enforcer")
             
-            self.results.append(("Imports", "PASS"))
+            self._record(("Imports", "PASS"))
             return True
             
         except Exception as e:
             print_error(f"Import failed: {e}")
-            self.results.append(("Imports", "FAIL"))
+            self._record(("Imports", "FAIL"))
             return False
     
     def test_policy_system(self):
@@ -123,16 +249,15 @@ class EndToEndTest:
         print_test("Testing external policy system")
         
         try:
-            from external_policy_system import (
-                SharedPolicyStore, PolicyRule, PolicySource, PolicyAction
-            )
+            if POLICY_SYSTEM_ERROR is not None:
+                raise POLICY_SYSTEM_ERROR
             
             # Create temporary database
-            self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
-            self.temp_db.close()
+            fd, self.temp_db = tempfile.mkstemp(suffix='.db', dir=SCRATCH_DIR)
+            os.close(fd)
             
-            # Initialize policy store
-            self.policy_store = SharedPolicyStore(self.temp_db.name)
+            # Initialize policy store (scratch database, no per-commit fsync)
+            self.policy_store = SharedPolicyStore(self.temp_db, durable=False)
             print_success("Policy store initialized")
             
             # Test policy creation
@@ -159,12 +284,12 @@ class EndToEndTest:
             assert effective_action == PolicyAction.BLOCK
             print_success("Effective action calculation works")
             
-            self.results.append(("Policy System", "PASS"))
+            self._record(("Policy System", "PASS"))
             return True
             
         except Exception as e:
             print_error(f"Policy system test failed: {e}")
-            self.results.append(("Policy System", "FAIL"))
+            self._record(("Policy System", "FAIL"))
             return False
     
     def test_adaptive_blocking(self):
@@ -172,7 +297,8 @@ class EndToEndTest:
         print_test("Testing adaptive blocking system")
         
         try:
-            from adaptive_blocking_system import AdaptiveBlockingSystem
+            if ADAPTIVE_BLOCKING_ERROR is not None:
+                raise ADAPTIVE_BLOCKING_ERROR
             
             # Create adaptive blocking system (needs policy_store)
             adaptive_system = AdaptiveBlockingSystem(self.policy_store)
@@ -189,10 +315,6 @@ class EndToEndTest:
                 'pattern_variability': 0.2
             }
             
-            threat_score = adaptive_system.calculate_threat_score(test_ip, normal_metrics)
-            threat_level = adaptive_system.determine_threat_level(threat_score)
-            print_success(f"Normal traffic analysis (threat: {threat_level.value})")
-            
             # Test with attack-like traffic metrics
             attack_metrics = {
                 'packet_rate': 1000.0,
@@ -201,9 +323,12 @@ class EndToEndTest:
                 'pattern_variability': 0.8
             }
             
-            threat_score = adaptive_system.calculate_threat_score(test_ip, attack_metrics)
-            threat_level = adaptive_system.determine_threat_level(threat_score)
-            print_success(f"Attack traffic analysis (threat: {threat_level.value})")
+            # Score both samples in one pass (single reputation lookup)
+            threat_scores = adaptive_system.calculate_threat_score_batch(
+                [test_ip, test_ip], [normal_metrics, attack_metrics])
+            normal_level, attack_level = adaptive_system.determine_threat_levels(threat_scores)
+            print_success(f"Normal traffic analysis (threat: {normal_level.value})")
+            print_success(f"Attack traffic analysis (threat: {attack_level.value})")
             
             # Test reputation system
             reputation = adaptive_system.reputation_system.get_reputation(test_ip)
@@ -213,12 +338,12 @@ class EndToEndTest:
             should_block, reason = adaptive_system.should_block(test_ip, attack_metrics)
             print_success(f"Blocking decision made: {should_block} ({reason})")
             
-            self.results.append(("Adaptive Blocking", "PASS"))
+            self._record(("Adaptive Blocking", "PASS"))
             return True
             
         except Exception as e:
             print_error(f"Adaptive blocking test failed: {e}")
-            self.results.append(("Adaptive Blocking", "FAIL"))
+            self._record(("Adaptive Blocking", "FAIL"))
             return False
     
     def test_controller_integration(self):
@@ -226,13 +351,11 @@ class EndToEndTest:
         print_test("Testing controller integration")
         
         try:
-            from modular_controller import (
-                NetworkMonitor, ThreatDetector, MitigationPolicy,
-                TrafficMetrics, ThreatEvent
-            )
+            if MODULAR_CONTROLLER_ERROR is not None:
+                raise MODULAR_CONTROLLER_ERROR
             
             # Create mock logger
-            logger = logging.getLogger("test_controller")
+            logger = _TEST_CTRL_LOG
             
             # Test NetworkMonitor
             monitor = NetworkMonitor(logger, monitoring_interval=1)
@@ -264,12 +387,12 @@ class EndToEndTest:
             # Test component communication (mock)
             print_success("Component integration verified")
             
-            self.results.append(("Controller Integration", "PASS"))
+            self._record(("Controller Integration", "PASS"))
             return True
             
         except Exception as e:
             print_error(f"Controller integration test failed: {e}")
-            self.results.append(("Controller Integration", "FAIL"))
+            self._record(("Controller Integration", "FAIL"))
             return False
     
     def test_enhanced_mitigation(self):
@@ -277,10 +400,11 @@ class EndToEndTest:
         print_test("Testing enhanced mitigation system")
         
         try:
-            from enhanced_mitigation_enforcer import EnhancedMitigationEnforcer
+            if ENHANCED_MITIGATION_ERROR is not None:
+                raise ENHANCED_MITIGATION_ERROR
             
             # Create mock logger and datapaths
-            logger = logging.getLogger("test_enforcer")
+            logger = _TEST_ENF_LOG
             datapaths = {}
             
             # Create enhanced enforcer
@@ -301,12 +425,21 @@ class EndToEndTest:
             action = enforcer.analyze_packet_in(mock_packet_data, 1, 1)
             print_success(f"Packet analysis: {action}")
             
-            self.results.append(("Enhanced Mitigation", "PASS"))
+            # Replay a burst through the per-packet path as a throughput check
+            replay_count = 1000
+            start = time.perf_counter()
+            for _ in range(replay_count):
+                enforcer.analyze_packet_in(mock_packet_data, 1, 1)
+            elapsed = time.perf_counter() - start
+            print_success(f"Packet replay: {replay_count} packets "
+                          f"({replay_count / elapsed:,.0f} packets/s)")
+            
+            self._record(("Enhanced Mitigation", "PASS"))
             return True
             
         except Exception as e:
             print_error(f"Enhanced mitigation test failed: {e}")
-            self.results.append(("Enhanced Mitigation", "FAIL"))
+            self._record(("Enhanced Mitigation", "FAIL"))
             return False
     
     def test_database_persistence(self):
@@ -314,10 +447,11 @@ class EndToEndTest:
         print_test("Testing database persistence")
         
         try:
-            from external_policy_system import SharedPolicyStore, PolicyRule, PolicySource, PolicyAction
+            if POLICY_SYSTEM_ERROR is not None:
+                raise POLICY_SYSTEM_ERROR
             
             # Create another policy store instance with same database
-            policy_store_2 = SharedPolicyStore(self.temp_db.name)
+            policy_store_2 = SharedPolicyStore(self.temp_db, durable=False)
             
             # Verify policies persist
             policies = policy_store_2.get_all_policies()
@@ -342,14 +476,14 @@ class EndToEndTest:
             assert len(all_policies) >= 2
             print_success("Cross-instance policy synchronization")
             
-            self.results.append(("Database Persistence", "PASS"))
+            self._record(("Database Persistence", "PASS"))
             return True
             
         except Exception as e:
-            print_error(f"Database persistence test failed: {e}")
-            import traceback
-            traceback.print_exc()
-            self.results.append(("Database Persistence", "FAIL"))
+            # One write, so a captured (parallel) run keeps the traceback with its test
+            details = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+            print_error(f"Database persistence test failed: {e}\n{details.rstrip()}")
+            self._record(("Database Persistence", "FAIL"))
             return False
     
     def test_conflict_resolution(self):
@@ -357,7 +491,8 @@ class EndToEndTest:
         print_test("Testing policy conflict resolution")
         
         try:
-            from external_policy_system import PolicyRule, PolicySource, PolicyAction
+            if POLICY_SYSTEM_ERROR is not None:
+                raise POLICY_SYSTEM_ERROR
             
             # Add conflicting policies for same target
             target_ip = "192.168.1.150"
@@ -384,8 +519,8 @@ class EndToEndTest:
                 reason="Admin override - false positive"
             )
             
-            self.policy_store.add_policy(block_policy)
-            self.policy_store.add_policy(allow_policy)
+            # Both policies are stored with a single commit
+            self.policy_store.add_policies((block_policy, allow_policy))
             
             # Test conflict resolution - should prioritize ALLOW (higher priority)
             effective_action = self.policy_store.get_effective_action("ip", target_ip)
@@ -400,20 +535,23 @@ class EndToEndTest:
             assert effective_action == PolicyAction.BLOCK
             print_success("Fallback to lower priority policy")
             
-            self.results.append(("Conflict Resolution", "PASS"))
+            self._record(("Conflict Resolution", "PASS"))
             return True
             
         except Exception as e:
             print_error(f"Conflict resolution test failed: {e}")
-            self.results.append(("Conflict Resolution", "FAIL"))
+            self._record(("Conflict Resolution", "FAIL"))
             return False
     
     def cleanup(self):
         """Clean up test resources"""
+        if not self.temp_db:
+            return
         try:
-            if self.temp_db and os.path.exists(self.temp_db.name):
-                os.unlink(self.temp_db.name)
-                print_success("Cleaned up temporary database")
+            os.unlink(self.temp_db)
+            print_success("Cleaned up temporary database")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print_warning(f"Cleanup warning: {e}")
     
@@ -423,28 +561,34 @@ class EndToEndTest:
         
         passed = 0
         failed = 0
+        skipped = 0
         
         for test_name, result in self.results:
             if result == "PASS":
                 print_success(f"{test_name}: {result}")
                 passed += 1
+            elif result == "SKIP":
+                print_warning(f"{test_name}: {result}")
+                skipped += 1
             else:
                 print_error(f"{test_name}: {result}")
                 failed += 1
         
-        print(f"\n{BLUE}Summary:{RESET}")
-        print(f"  {GREEN}Passed: {passed}{RESET}")
-        print(f"  {RED}Failed: {failed}{RESET}")
-        print(f"  {BLUE}Total:  {passed + failed}{RESET}")
+        summary = (f"\n{BLUE}Summary:{RESET}\n"
+                   f"  {GREEN}Passed: {passed}{RESET}\n"
+                   f"  {RED}Failed: {failed}{RESET}\n")
+        if skipped:
+            summary += f"  {YELLOW}Skipped: {skipped}{RESET}\n"
+        _write(summary + f"  {BLUE}Total:  {passed + failed + skipped}{RESET}")
         
-        if failed == 0:
+        if failed == 0 and skipped == 0:
             print(f"\n{GREEN}🎉 ALL TESTS PASSED! Your SDN system is working correctly!{RESET}")
             return True
         else:
             print(f"\n{RED}❌ Some tests failed. Check the output above for details.{RESET}")
             return False
     
-    def run_all_tests(self):
+    def run_all_tests(self, parallel=False):
         """Run all end-to-end tests"""
         print_header("SDN DOS MITIGATION - END-TO-END SYSTEM TEST")
         
@@ -452,13 +596,11 @@ class EndToEndTest:
         
         try:
             # Run all tests
-            self.test_imports()
-            self.test_policy_system()
-            self.test_adaptive_blocking()
-            self.test_controller_integration()
-            self.test_enhanced_mitigation()
-            self.test_database_persistence()
-            self.test_conflict_resolution()
+            if parallel:
+                self._run_parallel()
+            else:
+                for entry in self.TESTS:
+                    self._run_test(*entry)
             
             # Print results
             success = self.print_results()
@@ -492,7 +634,8 @@ class EndToEndTest:
 def main():
     """Main test execution"""
     test = EndToEndTest()
-    success = test.run_all_tests()
+    # --parallel runs the independent tests concurrently
+    success = test.run_all_tests(parallel="--parallel" in sys.argv[1:])
     sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
@@ -11,11 +11,12 @@ This module addresses the over-blocking flaw by implementing:
 # Import compatibility layer for Python 3.13
 import distutils_compat
 
+import sys
 import time
 import threading
 from collections import defaultdict, deque
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Set, Optional, Tuple
 
 try:
@@ -33,9 +34,9 @@ except ImportError:
     ether_types = MockEtherTypes()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FlowSignature:
-    """Represents a unique flow signature for tracking"""
+    """Represents a unique flow signature for tracking (immutable, used as a dict key)"""
     src_mac: str
     dst_mac: str
     src_ip: Optional[str] = None
@@ -43,16 +44,48 @@ class FlowSignature:
     protocol: Optional[int] = None
     src_port: Optional[int] = None
     dst_port: Optional[int] = None
+    _key: tuple = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+    _str_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        set_field = object.__setattr__
+        intern = sys.intern
+        # Intern the addresses: the same few MACs/IPs recur across many flows
+        src_mac = intern(self.src_mac) if self.src_mac else self.src_mac
+        dst_mac = intern(self.dst_mac) if self.dst_mac else self.dst_mac
+        src_ip = intern(self.src_ip) if self.src_ip else self.src_ip
+        dst_ip = intern(self.dst_ip) if self.dst_ip else self.dst_ip
+        set_field(self, 'src_mac', src_mac)
+        set_field(self, 'dst_mac', dst_mac)
+        set_field(self, 'src_ip', src_ip)
+        set_field(self, 'dst_ip', dst_ip)
+        # All identity fields in one tuple, built once for hashing and comparison
+        key = (src_mac, dst_mac, src_ip, dst_ip, self.protocol, self.src_port, self.dst_port)
+        set_field(self, '_key', key)
+        set_field(self, '_hash', hash(key))
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._hash == other._hash and self._key == other._key
     
     def __hash__(self):
-        return hash((self.src_mac, self.dst_mac, self.src_ip, self.dst_ip, 
-                    self.protocol, self.src_port, self.dst_port))
+        return self._hash
+    
+    def __str__(self):
+        return self.to_string()
     
     def to_string(self):
-        """Human-readable string representation"""
-        if self.src_ip:
-            return f"{self.src_ip}:{self.src_port or '*'} -> {self.dst_ip}:{self.dst_port or '*'}"
-        return f"{self.src_mac} -> {self.dst_mac}"
+        """Human-readable string representation (built once, the signature is immutable)"""
+        text = self._str_cache
+        if text is None:
+            if self.src_ip:
+                text = f"{self.src_ip}:{self.src_port or '*'} -> {self.dst_ip}:{self.dst_port or '*'}"
+            else:
+                text = f"{self.src_mac} -> {self.dst_mac}"
+            object.__setattr__(self, '_str_cache', text)
+        return text
 
 
 @dataclass
@@ -108,24 +141,30 @@ class FlowAnalyzer:
     def add_to_whitelist(self, address: str):
         """Add address to whitelist (MAC or IP)"""
         self.whitelist.add(address)
-        self.logger.info(f"Added {address} to whitelist")
+        self.logger.info("Added %s to whitelist", address)
     
     def add_to_blacklist(self, address: str):
         """Add address to blacklist (MAC or IP)"""
         self.blacklist.add(address)
-        self.logger.info(f"Added {address} to blacklist")
+        self.logger.info("Added %s to blacklist", address)
     
     def is_whitelisted(self, flow_sig: FlowSignature) -> bool:
         """Check if flow involves whitelisted addresses"""
-        return (flow_sig.src_mac in self.whitelist or 
-                flow_sig.dst_mac in self.whitelist or
-                (flow_sig.src_ip and flow_sig.src_ip in self.whitelist) or
-                (flow_sig.dst_ip and flow_sig.dst_ip in self.whitelist))
+        whitelist = self.whitelist
+        if not whitelist:  # Common case: nothing to probe
+            return False
+        # The lists only hold address strings, so a missing IP (None) never matches
+        return (flow_sig.src_mac in whitelist or
+                flow_sig.dst_mac in whitelist or
+                flow_sig.src_ip in whitelist or
+                flow_sig.dst_ip in whitelist)
     
     def is_blacklisted(self, flow_sig: FlowSignature) -> bool:
         """Check if flow involves blacklisted addresses"""
-        return (flow_sig.src_mac in self.blacklist or
-                (flow_sig.src_ip and flow_sig.src_ip in self.blacklist))
+        blacklist = self.blacklist
+        if not blacklist:
+            return False
+        return flow_sig.src_mac in blacklist or flow_sig.src_ip in blacklist
     
     def analyze_packet(self, pkt_data: bytes, in_port: int) -> Tuple[FlowSignature, str]:
         """Analyze packet and return flow signature and threat level"""
@@ -139,33 +178,40 @@ class FlowAnalyzer:
         if eth.ethertype == ether_types.ETH_TYPE_LLDP:
             return None, "benign"
         
-        # Create basic flow signature
-        flow_sig = FlowSignature(
-            src_mac=eth.src,
-            dst_mac=eth.dst
-        )
+        # Collect the flow fields (FlowSignature is immutable once built)
+        src_ip = dst_ip = protocol = src_port = dst_port = None
         
         # Extract IP layer information
         ip_pkt = pkt.get_protocol(ipv4.ipv4)
         if ip_pkt:
-            flow_sig.src_ip = ip_pkt.src
-            flow_sig.dst_ip = ip_pkt.dst
-            flow_sig.protocol = ip_pkt.proto
+            src_ip = ip_pkt.src
+            dst_ip = ip_pkt.dst
+            protocol = ip_pkt.proto
             
             # Extract transport layer information
             tcp_pkt = pkt.get_protocol(tcp.tcp)
             if tcp_pkt:
-                flow_sig.src_port = tcp_pkt.src_port
-                flow_sig.dst_port = tcp_pkt.dst_port
+                src_port = tcp_pkt.src_port
+                dst_port = tcp_pkt.dst_port
                 
                 # Check for SYN flood
                 if tcp_pkt.bits & tcp.TCP_SYN and not tcp_pkt.bits & tcp.TCP_ACK:
-                    self.connection_attempts[flow_sig.src_ip] += 1
+                    self.connection_attempts[src_ip] += 1
             
             udp_pkt = pkt.get_protocol(udp.udp)
             if udp_pkt:
-                flow_sig.src_port = udp_pkt.src_port
-                flow_sig.dst_port = udp_pkt.dst_port
+                src_port = udp_pkt.src_port
+                dst_port = udp_pkt.dst_port
+        
+        flow_sig = FlowSignature(
+            src_mac=eth.src,
+            dst_mac=eth.dst,
+            src_ip=src_ip,
+            dst_ip=dst_ip,
+            protocol=protocol,
+            src_port=src_port,
+            dst_port=dst_port
+        )
         
         # Determine threat level
         threat_level = self._assess_threat_level(flow_sig, len(pkt_data))
@@ -202,11 +248,10 @@ class FlowAnalyzer:
         if self.is_whitelisted(flow_sig):
             return "benign"
         
-        # Update flow statistics
-        if flow_sig not in self.flow_stats:
-            self.flow_stats[flow_sig] = FlowStats()
-        
-        stats = self.flow_stats[flow_sig]
+        # Update flow statistics (one lookup on the common, already-tracked path)
+        stats = self.flow_stats.get(flow_sig)
+        if stats is None:
+            stats = self.flow_stats[flow_sig] = FlowStats()
         stats.update(1, packet_size)
         
         # Check for high rate
@@ -308,7 +353,7 @@ class EnhancedMitigationEnforcer:
     def _execute_enhanced_action(self, action):
         """Execute enhanced mitigation action with flow-level granularity"""
         if action.switch_id not in self.datapaths:
-            self.logger.error(f"Switch {action.switch_id:016x} not found")
+            self.logger.error("Switch %016x not found", action.switch_id)
             return
         
         datapath = self.datapaths[action.switch_id]
@@ -317,7 +362,7 @@ class EnhancedMitigationEnforcer:
         malicious_flows = self._identify_malicious_flows(action.switch_id, action.port_no)
         
         if not malicious_flows:
-            self.logger.warning(f"No malicious flows identified for port {action.port_no}")
+            self.logger.warning("No malicious flows identified for port %s", action.port_no)
             return
         
         # Apply graduated response
@@ -359,7 +404,7 @@ class EnhancedMitigationEnforcer:
         )
         
         datapath.send_msg(flow_mod)
-        self.logger.info(f"🔍 Monitoring flow: {flow_sig.to_string()}")
+        self.logger.info("🔍 Monitoring flow: %s", flow_sig)
     
     def _rate_limit_flow(self, datapath, flow_sig: FlowSignature, priority: int):
         """Apply rate limiting to specific flow"""
@@ -385,7 +430,7 @@ class EnhancedMitigationEnforcer:
         
         datapath.send_msg(flow_mod)
         self.rate_limited_flows.add(flow_sig)
-        self.logger.info(f"⚠️  Rate limited flow: {flow_sig.to_string()}")
+        self.logger.info("⚠️  Rate limited flow: %s", flow_sig)
     
     def _block_flow(self, datapath, flow_sig: FlowSignature, priority: int):
         """Block specific flow (not entire port)"""
@@ -412,7 +457,7 @@ class EnhancedMitigationEnforcer:
             self.flow_analyzer.add_to_blacklist(flow_sig.src_ip)
         self.flow_analyzer.add_to_blacklist(flow_sig.src_mac)
         
-        self.logger.info(f"🚫 Blocked malicious flow: {flow_sig.to_string()}")
+        self.logger.info("🚫 Blocked malicious flow: %s", flow_sig)
     
     def _unblock_flow(self, datapath, flow_sig: FlowSignature):
         """Unblock specific flow"""
@@ -438,7 +483,7 @@ class EnhancedMitigationEnforcer:
             self.flow_analyzer.blacklist.discard(flow_sig.src_ip)
         self.flow_analyzer.blacklist.discard(flow_sig.src_mac)
         
-        self.logger.info(f"✅ Unblocked flow: {flow_sig.to_string()}")
+        self.logger.info("✅ Unblocked flow: %s", flow_sig)
     
     def _create_flow_match(self, parser, flow_sig: FlowSignature):
         """Create OpenFlow match from flow signature"""
@@ -18,6 +18,7 @@ import time
 import socket
 import sqlite3
 import os
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass, asdict
@@ -43,9 +44,9 @@ class PolicyAction(Enum):
     MONITOR = "monitor"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PolicyRule:
-    """Represents a policy rule"""
+    """Represents a policy rule (immutable once created)"""
     id: str
     source: PolicySource
     action: PolicyAction
@@ -59,15 +60,15 @@ class PolicyRule:
     
     def __post_init__(self):
         if self.created_at is None:
-            self.created_at = datetime.now()
+            object.__setattr__(self, 'created_at', datetime.now())
         if self.metadata is None:
-            self.metadata = {}
+            object.__setattr__(self, 'metadata', {})
     
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
         """Check if the policy rule has expired"""
         if self.expiry is None:
             return False
-        return datetime.now() > self.expiry
+        return (now or datetime.now()) > self.expiry
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization"""
@@ -87,11 +88,16 @@ class SharedPolicyStore:
     Supports multiple readers/writers and persistence
     """
     
-    def __init__(self, db_path: str = "policy_store.db"):
+    def __init__(self, db_path: str = "policy_store.db", durable: bool = True):
         self.db_path = db_path
+        # durable=False trades crash durability of the last commits for speed
+        # (WAL journal, no fsync per commit); meant for tests and scratch stores
+        self.durable = durable
         self._lock = threading.RLock()
         self._policies: Dict[str, PolicyRule] = {}
         self._listeners: List[Callable] = []
+        # (target_type, target_value) -> (action, earliest expiry); cleared on writes
+        self._effective_cache: Dict[tuple, tuple] = {}
         self._init_database()
         self._load_policies()
         
@@ -99,9 +105,23 @@ class SharedPolicyStore:
         self._cleanup_thread = threading.Thread(target=self._cleanup_expired, daemon=True)
         self._cleanup_thread.start()
     
+    @contextmanager
+    def _connect(self):
+        """Database connection that commits on success and is always closed"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            if not self.durable:
+                conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
     def _init_database(self):
         """Initialize SQLite database for persistence"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            if not self.durable:
+                conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS policies (
                     id TEXT PRIMARY KEY,
@@ -127,9 +147,9 @@ class SharedPolicyStore:
     
     def _load_policies(self):
         """Load policies from database"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT * FROM policies")
-            for row in cursor.fetchall():
+        with self._connect() as conn:
+            now = datetime.now()
+            for row in conn.execute(self._SELECT_POLICIES):
                 try:
                     policy = PolicyRule(
                         id=row[0],
@@ -143,35 +163,55 @@ class SharedPolicyStore:
                         metadata=json.loads(row[8]) if row[8] else {},
                         created_at=datetime.fromisoformat(row[9])
                     )
-                    if not policy.is_expired():
+                    if not policy.is_expired(now):
                         self._policies[policy.id] = policy
                 except Exception as e:
                     print(f"Error loading policy {row[0]}: {e}")
     
+    _EFFECTIVE_CACHE_SIZE = 4096
+    
+    _SELECT_POLICIES = """
+        SELECT id, source, action, target_type, target_value, priority,
+               expiry, reason, metadata, created_at
+        FROM policies
+    """
+    
+    _INSERT_POLICY = """
+        INSERT OR REPLACE INTO policies 
+        (id, source, action, target_type, target_value, priority, 
+         expiry, reason, metadata, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    @staticmethod
+    def _policy_row(policy: PolicyRule) -> tuple:
+        """Database row for a policy"""
+        return (
+            policy.id,
+            policy.source.value,
+            policy.action.value,
+            policy.target_type,
+            policy.target_value,
+            policy.priority,
+            policy.expiry.isoformat() if policy.expiry else None,
+            policy.reason,
+            json.dumps(policy.metadata),
+            policy.created_at.isoformat()
+        )
+    
     def _save_policy(self, policy: PolicyRule):
         """Save policy to database"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO policies 
-                (id, source, action, target_type, target_value, priority, 
-                 expiry, reason, metadata, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                policy.id,
-                policy.source.value,
-                policy.action.value,
-                policy.target_type,
-                policy.target_value,
-                policy.priority,
-                policy.expiry.isoformat() if policy.expiry else None,
-                policy.reason,
-                json.dumps(policy.metadata),
-                policy.created_at.isoformat()
-            ))
+        with self._connect() as conn:
+            conn.execute(self._INSERT_POLICY, self._policy_row(policy))
+    
+    def _save_policies(self, policies: List[PolicyRule]):
+        """Save several policies to database in one transaction"""
+        with self._connect() as conn:
+            conn.executemany(self._INSERT_POLICY, map(self._policy_row, policies))
     
     def _delete_policy_from_db(self, policy_id: str):
         """Delete policy from database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute("DELETE FROM policies WHERE id = ?", (policy_id,))
     
     def add_policy(self, policy: PolicyRule) -> bool:
@@ -181,15 +221,32 @@ class SharedPolicyStore:
                 return False
             
             self._policies[policy.id] = policy
+            self._effective_cache.clear()
             self._save_policy(policy)
             self._notify_listeners('add', policy)
             return True
     
+    def add_policies(self, policies) -> int:
+        """Add several policy rules with a single database commit"""
+        with self._lock:
+            policies = [policy for policy in policies if not policy.is_expired()]
+            if not policies:
+                return 0
+            
+            for policy in policies:
+                self._policies[policy.id] = policy
+            self._effective_cache.clear()
+            self._save_policies(policies)
+            for policy in policies:
+                self._notify_listeners('add', policy)
+            return len(policies)
+    
     def remove_policy(self, policy_id: str) -> bool:
         """Remove a policy rule"""
         with self._lock:
             if policy_id in self._policies:
                 policy = self._policies.pop(policy_id)
+                self._effective_cache.clear()
                 self._delete_policy_from_db(policy_id)
                 self._notify_listeners('remove', policy)
                 return True
@@ -202,25 +259,38 @@ class SharedPolicyStore:
     
     def get_policies_for_target(self, target_type: str, target_value: str) -> List[PolicyRule]:
         """Get all policies for a specific target, sorted by priority"""
+        now = datetime.now()
         with self._lock:
             policies = [
                 p for p in self._policies.values()
                 if p.target_type == target_type and p.target_value == target_value
-                and not p.is_expired()
+                and not p.is_expired(now)
             ]
             return sorted(policies, key=lambda p: p.priority, reverse=True)
     
     def get_all_policies(self) -> List[PolicyRule]:
         """Get all active policies"""
+        now = datetime.now()
         with self._lock:
-            return [p for p in self._policies.values() if not p.is_expired()]
+            return [p for p in self._policies.values() if not p.is_expired(now)]
     
     def get_effective_action(self, target_type: str, target_value: str) -> Optional[PolicyAction]:
         """Get the effective action for a target (highest priority wins)"""
-        policies = self.get_policies_for_target(target_type, target_value)
-        if policies:
-            return policies[0].action
-        return None
+        key = (target_type, target_value)
+        now = datetime.now()
+        with self._lock:
+            cached = self._effective_cache.get(key)
+            # Valid until a write or until one of the target's policies expires
+            if cached is not None and (cached[1] is None or now <= cached[1]):
+                return cached[0]
+            
+            policies = self.get_policies_for_target(target_type, target_value)
+            action = policies[0].action if policies else None
+            expiries = [p.expiry for p in policies if p.expiry is not None]
+            if len(self._effective_cache) >= self._EFFECTIVE_CACHE_SIZE:
+                self._effective_cache.clear()
+            self._effective_cache[key] = (action, min(expiries, default=None))
+            return action
     
     def add_listener(self, callback: Callable):
         """Add a listener for policy changes"""
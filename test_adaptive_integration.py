@@ -213,6 +213,41 @@ def test_standalone_adaptive_system():
         traceback.print_exc()
         return False
 
+def test_reputation_address_keys():
+    """Test that non-canonical address strings keep their own reputation"""
+    try:
+        print("\n🔄 Testing reputation keys for non-canonical addresses...")
+        
+        import tempfile
+        from adaptive_blocking_system import ReputationSystem
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            reputation_system = ReputationSystem(os.path.join(tmp_dir, "reputation.db"))
+            reputation_system.update_reputation("10.0.0.1", is_malicious=True)
+            canonical = reputation_system.get_reputation("10.0.0.1")
+            
+            for alias in ("10.1", "10.0.1", "167772161", "010.0.0.1", "10.0.0.1 x"):
+                score = reputation_system.get_reputation(alias)
+                assert score == 0.5, f"{alias!r} shares the score of 10.0.0.1"
+            
+            # A score stored under an alias must not overwrite the canonical one
+            reputation_system.update_reputation("010.0.0.1", is_malicious=False)
+            assert reputation_system.get_reputation("10.0.0.1") == canonical
+            
+            # Reloading from SQLite keeps the keys apart as well
+            reloaded = ReputationSystem(reputation_system.db_path)
+            assert reloaded.get_reputation("10.0.0.1") == canonical
+            assert reloaded.get_reputation("010.0.0.1") != canonical
+        
+        print("✅ Reputation key test passed!")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Reputation key test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def main():
     """Main test function"""
     print("Starting adaptive blocking integration tests...\n")
@@ -220,6 +255,9 @@ def main():
     # Test standalone system first
     standalone_result = test_standalone_adaptive_system()
     
+    # Test reputation address keys
+    reputation_keys_result = test_reputation_address_keys()
+    
     # Test integration
     integration_result = test_adaptive_integration()
     
@@ -227,9 +265,10 @@ def main():
     print("🎯 TEST RESULTS")
     print("=" * 70)
     print(f"Standalone System: {'✅ PASSED' if standalone_result else '❌ FAILED'}")
+    print(f"Reputation Keys:   {'✅ PASSED' if reputation_keys_result else '❌ FAILED'}")
     print(f"Integration Test:  {'✅ PASSED' if integration_result else '❌ FAILED'}")
     
-    if standalone_result and integration_result:
+    if standalone_result and reputation_keys_result and integration_result:
         print("\n🎉 ALL TESTS PASSED! Adaptive blocking system is ready for use.")
         print("\n📝 Integration Summary:")
         print("   ✅ Adaptive blocking system integrated with modular controller")
@@ -241,7 +280,7 @@ def main():
     else:
         print("\n❌ Some tests failed. Please check the errors above.")
     
-    return standalone_result and integration_result
+    return standalone_result and reputation_keys_result and integration_result
 
 if __name__ == "__main__":
     # Configure logging
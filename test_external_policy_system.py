@@ -196,6 +196,76 @@ class TestExternalPolicySystem(unittest.TestCase):
         self.assertEqual(retrieved_policy.target_value, "10.0.0.5")
         self.assertEqual(retrieved_policy.action, PolicyAction.BLOCK)
     
+    def test_policy_store_batch_add(self):
+        """Test adding several policies in one batch"""
+        policies = [
+            PolicyRule(
+                id=f"batch_policy_{i}",
+                source=PolicySource.IDS,
+                action=PolicyAction.BLOCK,
+                target_type="ip",
+                target_value=f"10.0.1.{i}",
+                priority=60,
+                reason="Batch test"
+            )
+            for i in range(2)
+        ]
+        policies.append(PolicyRule(
+            id="batch_expired",
+            source=PolicySource.IDS,
+            action=PolicyAction.BLOCK,
+            target_type="ip",
+            target_value="10.0.1.9",
+            priority=60,
+            expiry=datetime.now() - timedelta(minutes=1)
+        ))
+        
+        # Expired policies are skipped
+        self.assertEqual(self.policy_store.add_policies(policies), 2)
+        self.assertIsNone(self.policy_store.get_policy("batch_expired"))
+        
+        # The batch is persisted
+        new_store = SharedPolicyStore(self.db_path)
+        self.assertIsNotNone(new_store.get_policy("batch_policy_0"))
+        self.assertEqual(new_store.get_effective_action("ip", "10.0.1.1"), PolicyAction.BLOCK)
+    
+    def test_effective_action_cache_invalidation(self):
+        """Test cached effective actions follow policy changes and expiry"""
+        target_ip = "10.0.2.1"
+        self.assertIsNone(self.policy_store.get_effective_action("ip", target_ip))
+        
+        short_block = PolicyRule(
+            id="short_block",
+            source=PolicySource.IDS,
+            action=PolicyAction.BLOCK,
+            target_type="ip",
+            target_value=target_ip,
+            priority=80,
+            expiry=datetime.now() + timedelta(seconds=1),
+            reason="Short block"
+        )
+        monitor = PolicyRule(
+            id="monitor",
+            source=PolicySource.CONTROLLER,
+            action=PolicyAction.MONITOR,
+            target_type="ip",
+            target_value=target_ip,
+            priority=20,
+            reason="Monitor"
+        )
+        
+        # Adding policies replaces the cached "no policy" answer
+        self.policy_store.add_policies([short_block, monitor])
+        self.assertEqual(self.policy_store.get_effective_action("ip", target_ip), PolicyAction.BLOCK)
+        
+        # Expiry of the winning policy is picked up without a write
+        time.sleep(1.1)
+        self.assertEqual(self.policy_store.get_effective_action("ip", target_ip), PolicyAction.MONITOR)
+        
+        # Removal invalidates the cached action
+        self.policy_store.remove_policy("monitor")
+        self.assertIsNone(self.policy_store.get_effective_action("ip", target_ip))
+    
     def test_external_connector_integration(self):
         """Test external policy connector"""
         # Simulate external threat intelligence